@@ -1,12 +1,35 @@
 import operator
+from collections import defaultdict
 import typing as t
 
 
+def _index_key_getter(attrs):
+    """
+    获取生成索引键的函数
+
+    Args:
+        attrs (tuple[str]): 属性名
+
+    Returns:
+        callable: 接收网格，返回属性值组成的元组
+    """
+    if not attrs:
+        return lambda grid: ()
+    if len(attrs) == 1:
+        # attrgetter只有一个属性时返回值本身，索引键仍然使用元组
+        getter = operator.attrgetter(attrs[0])
+        return lambda grid: (getter(grid),)
+    return operator.attrgetter(*attrs)
+
+
 class SelectedGrids:
     """
     网格选择器类，用于管理和操作一组网格
     提供了丰富的网格筛选、排序和操作方法
     """
+    # 筛选和排序会频繁创建新实例，不需要实例字典
+    __slots__ = ('grids', 'indexes')
+
     def __init__(self, grids):
         """
         初始化网格选择器
@@ -102,15 +125,25 @@ class SelectedGrids:
         Returns:
             SelectedGrids: 筛选后的网格集合
         """
-        def matched(obj):
-            flag = True
-            for k, v in kwargs.items():
-                obj_v = obj.__getattribute__(k)
-                if type(obj_v) != type(v) or obj_v != v:
-                    flag = False
-            return flag
-
-        return SelectedGrids([grid for grid in self.grids if matched(grid)])
+        if not kwargs:
+            return SelectedGrids(list(self.grids))
+        if len(kwargs) == 1:
+            # 单个属性时不需要打包成元组
+            (key, value), = kwargs.items()
+            getter = operator.attrgetter(key)
+            value_type = type(value)
+            return SelectedGrids([
+                grid for grid in self.grids
+                if type(obj_v := getter(grid)) == value_type and obj_v == value
+            ])
+
+        getter = operator.attrgetter(*kwargs)
+        values = tuple(kwargs.values())
+        types = tuple(map(type, values))
+        return SelectedGrids([
+            grid for grid in self.grids
+            if tuple(map(type, obj_v := getter(grid))) == types and obj_v == values
+        ])
 
     def create_index(self, *attrs):
         """
@@ -122,13 +155,10 @@ class SelectedGrids:
         Returns:
             dict: 索引字典
         """
-        indexes = {}
+        getter = _index_key_getter(attrs)
+        indexes = defaultdict(list)
         for grid in self.grids:
-            k = tuple(grid.__getattribute__(attr) for attr in attrs)
-            try:
-                indexes[k].append(grid)
-            except KeyError:
-                indexes[k] = [grid]
+            indexes[getter(grid)].append(grid)
 
         indexes = {k: SelectedGrids(v) for k, v in indexes.items()}
         self.indexes = indexes
@@ -159,16 +189,20 @@ class SelectedGrids:
         Returns:
             SelectedGrids: 处理后的网格集合
         """
-        right.create_index(*on_attr)
+        # 同时填充right.indexes，之后仍可以调用right.indexed_select()
+        # 每个键只取第一个网格，同indexed_select().first_or_none()
+        index = {k: v.grids[0] for k, v in right.create_index(*on_attr).items()}
+        getter = _index_key_getter(on_attr)
+
+        set_attr = tuple(set_attr)
         for grid in self:
-            attr_value = tuple([grid.__getattribute__(attr) for attr in on_attr])
-            right_grid = right.indexed_select(*attr_value).first_or_none()
+            right_grid = index.get(getter(grid))
             if right_grid is not None:
                 for attr in set_attr:
-                    grid.__setattr__(attr, right_grid.__getattribute__(attr))
+                    setattr(grid, attr, getattr(right_grid, attr))
             else:
                 for attr in set_attr:
-                    grid.__setattr__(attr, default)
+                    setattr(grid, attr, default)
 
         return self
 
@@ -191,9 +225,10 @@ class SelectedGrids:
         Args:
             **kwargs: 属性名和值
         """
-        for grid in self:
-            for key, value in kwargs.items():
-                grid.__setattr__(key, value)
+        items = tuple(kwargs.items())
+        for grid in self.grids:
+            for key, value in items:
+                setattr(grid, key, value)
 
     def get(self, attr):
         """
@@ -205,7 +240,7 @@ class SelectedGrids:
         Returns:
             list: 属性值列表
         """
-        return [grid.__getattribute__(attr) for grid in self.grids]
+        return list(map(operator.attrgetter(attr), self.grids))
 
     def call(self, func, **kwargs):
         """
@@ -218,7 +253,7 @@ class SelectedGrids:
         Returns:
             list: 方法返回值列表
         """
-        return [grid.__getattribute__(func)(**kwargs) for grid in self]
+        return list(map(operator.methodcaller(func, **kwargs), self.grids))
 
     def first_or_none(self):
         """
@@ -242,7 +277,8 @@ class SelectedGrids:
         Returns:
             SelectedGrids: 合并后的网格集合
         """
-        return SelectedGrids(list(set(self.grids + grids.grids)))
+        # dict去重的同时保留原有顺序
+        return SelectedGrids(list(dict.fromkeys(self.grids + grids.grids)))
 
     def add_by_eq(self, grids):
         """
@@ -271,7 +307,8 @@ class SelectedGrids:
         Returns:
             SelectedGrids: 交集网格集合
         """
-        return SelectedGrids(list(set(self.grids).intersection(set(grids.grids))))
+        other = set(grids.grids)
+        return SelectedGrids([grid for grid in dict.fromkeys(self.grids) if grid in other])
 
     def intersect_by_eq(self, grids):
         """
@@ -300,7 +337,12 @@ class SelectedGrids:
         Returns:
             SelectedGrids: 删除后的网格集合
         """
-        g = [grid for grid in self.grids if grid not in grids]
+        try:
+            other = set(grids)
+        except TypeError:
+            # 不可哈希的网格退回逐个比较
+            other = grids
+        g = [grid for grid in self.grids if grid not in other]
         return SelectedGrids(g)
 
     def sort(self, *args):
@@ -334,9 +376,10 @@ class SelectedGrids:
         import numpy as np
         if not self:
             return self
-        location = np.array(self.location)
-        diff = np.sum(np.abs(location - camera), axis=1)
-        grids = tuple(np.array(self.grids)[np.argsort(diff)])
+        diff = np.abs(np.array(self.location) - camera).sum(axis=1)
+        # 按下标取网格，不把网格对象转换成numpy数组
+        grids = self.grids
+        grids = tuple(grids[index] for index in np.argsort(diff, kind='stable'))
         return SelectedGrids(grids)
 
     def sort_by_clock_degree(self, center=(0, 0), start=(0, 1), clockwise=True):
@@ -355,13 +398,15 @@ class SelectedGrids:
         if not self:
             return self
         vector = np.subtract(self.location, center)
-        theta = np.arctan2(vector[:, 1], vector[:, 0]) / np.pi * 180
+        theta = np.arctan2(vector[:, 1], vector[:, 0])
+        # 只用于排序，直接用弧度，不转换成角度
         vector = np.subtract(start, center)
-        theta = theta - np.arctan2(vector[1], vector[0]) / np.pi * 180
+        theta -= np.arctan2(vector[1], vector[0])
         if not clockwise:
-            theta = -theta
-        theta[theta < 0] += 360
-        grids = tuple(np.array(self.grids)[np.argsort(theta)])
+            np.negative(theta, out=theta)
+        np.mod(theta, 2 * np.pi, out=theta)
+        grids = self.grids
+        grids = tuple(grids[index] for index in np.argsort(theta))
         return SelectedGrids(grids)
 
 
@@ -370,6 +415,8 @@ class RoadGrids:
     道路网格类，用于管理道路相关的网格集合
     提供了道路障碍物检测和路径组合等功能
     """
+    __slots__ = ('grids',)
+
     def __init__(self, grids):
         """
         初始化道路网格
@@ -388,6 +435,29 @@ class RoadGrids:
         """返回道路网格的字符串表示"""
         return str(' - '.join([str(grid) for grid in self.grids]))
 
+    @staticmethod
+    def _block_stats(block):
+        """
+        遍历一次路段，统计敌人和舰队、已清理网格的情况
+
+        Args:
+            block (SelectedGrids): 路段
+
+        Returns:
+            tuple[list, bool, bool]: 敌人网格列表，是否有舰队，是否有已清理的网格
+        """
+        enemies = []
+        has_fleet = False
+        has_cleared = False
+        for grid in block.grids:
+            if grid.is_enemy is True:
+                enemies.append(grid)
+            if grid.is_fleet:
+                has_fleet = True
+            if grid.is_cleared:
+                has_cleared = True
+        return enemies, has_fleet, has_cleared
+
     def roadblocks(self):
         """
         获取所有道路障碍物
@@ -397,8 +467,9 @@ class RoadGrids:
         """
         grids = []
         for block in self.grids:
-            if block.count == block.select(is_enemy=True).count:
-                grids += block.grids
+            enemies, _, _ = self._block_stats(block)
+            if block.count == len(enemies):
+                grids.extend(block.grids)
         return SelectedGrids(grids)
 
     def potential_roadblocks(self):
@@ -410,12 +481,11 @@ class RoadGrids:
         """
         grids = []
         for block in self.grids:
-            if any([grid.is_fleet for grid in block]):
+            enemies, has_fleet, has_cleared = self._block_stats(block)
+            if has_fleet or has_cleared:
                 continue
-            if any([grid.is_cleared for grid in block]):
-                continue
-            if block.count - block.select(is_enemy=True).count == 1:
-                grids += block.select(is_enemy=True).grids
+            if block.count - len(enemies) == 1:
+                grids.extend(enemies)
         return SelectedGrids(grids)
 
     def first_roadblocks(self):
@@ -427,12 +497,11 @@ class RoadGrids:
         """
         grids = []
         for block in self.grids:
-            if any([grid.is_fleet for grid in block]):
-                continue
-            if any([grid.is_cleared for grid in block]):
+            enemies, has_fleet, has_cleared = self._block_stats(block)
+            if has_fleet or has_cleared:
                 continue
-            if block.select(is_enemy=True).count >= 1:
-                grids += block.select(is_enemy=True).grids
+            if enemies:
+                grids.extend(enemies)
         return SelectedGrids(grids)
 
     def combine(self, road):
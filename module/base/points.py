@@ -1,7 +1,13 @@
 import numpy as np
 from scipy import optimize
 
-from module.base.utils.utils import area_pad
+from module.base.utils.image_utils import area_pad
+
+# numba为可选依赖，安装后fit_points的目标函数会被编译
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 class Points:
@@ -9,6 +15,9 @@ class Points:
     点集合类，用于处理二维平面上的点集合
     支持点的基本操作、分组和连线等功能
     """
+    # 分组和连线时会创建大量临时对象，不需要实例字典
+    __slots__ = ('_bool', 'points', 'x', 'y')
+
     def __init__(self, points):
         """
         初始化点集合
@@ -100,14 +109,15 @@ class Points:
         if len(points) == 1:
             return np.array([points[0]])
 
+        # 每轮以剩余的第一个点为中心取出一组，直接在数组上计算均值，不创建Points对象
         while len(points):
             p0, p1 = points[0], points[1:]
             distance = np.sum(np.abs(p1 - p0), axis=1)
-            new = Points(np.append(p1[distance <= threshold], [p0], axis=0)).mean().tolist()
-            groups.append(new)
+            group = np.concatenate((p1[distance <= threshold], p0[np.newaxis]))
+            groups.append(np.mean(group, axis=0))
             points = p1[distance > threshold]
 
-        return np.array(groups)
+        return np.round(groups).astype(int)
 
 
 class Lines:
@@ -117,6 +127,8 @@ class Lines:
     """
     MID_Y = 360  # 用于计算直线中点的y坐标
 
+    __slots__ = ('_bool', 'lines', 'rho', 'theta', 'sin', 'cos', 'is_horizontal')
+
     def __init__(self, lines, is_horizontal):
         """
         初始化直线集合
@@ -134,6 +146,9 @@ class Lines:
             if len(self.lines.shape) == 1:
                 self.lines = np.array([self.lines])
             self.rho, self.theta = self.lines.T
+            # theta在对象创建后不会改变，三角函数值只算一次
+            self.sin = np.sin(self.theta)
+            self.cos = np.cos(self.theta)
         self.is_horizontal = is_horizontal
 
     def __str__(self):
@@ -160,16 +175,6 @@ class Lines:
         """判断直线集合是否为空"""
         return self._bool
 
-    @property
-    def sin(self):
-        """获取所有直线的sin(theta)值"""
-        return np.sin(self.theta)
-
-    @property
-    def cos(self):
-        """获取所有直线的cos(theta)值"""
-        return np.cos(self.theta)
-
     @property
     def mean(self):
         """
@@ -260,6 +265,7 @@ class Lines:
         if self.is_horizontal:
             self.lines[:, 0] += y
         else:
+            # 只移动rho，theta不变，sin和cos仍然有效
             self.lines[:, 0] += x * self.cos + y * self.sin
         return Lines(self.lines, is_horizontal=self.is_horizontal)
 
@@ -288,23 +294,17 @@ class Lines:
         if not self:
             return self
         lines = self.sort()
-        prev = 0
-        regrouped = []
-        group = []
-        for mid, line in zip(lines.mid, lines.lines):
-            line = line.tolist()
-            if mid - prev > threshold:
-                if len(regrouped) == 0:
-                    if len(group) != 0:
-                        regrouped = [group]
-                else:
-                    regrouped += [group]
-                group = [line]
-            else:
-                group.append(line)
-            prev = mid
-        regrouped += [group]
-        regrouped = np.vstack([Lines(r, is_horizontal=self.is_horizontal).mean for r in regrouped])
+        mid = lines.mid
+        # 排序后相邻中点相差超过阈值的位置就是新一组的开始
+        starts = np.append(0, np.flatnonzero(np.diff(mid) > threshold) + 1)
+        counts = np.diff(np.append(starts, len(mid)))
+        if self.is_horizontal:
+            regrouped = np.add.reduceat(lines.lines, starts, axis=0) / counts[:, np.newaxis]
+        else:
+            x = np.add.reduceat(mid, starts) / counts
+            theta = np.add.reduceat(lines.theta, starts) / counts
+            rho = x * np.cos(theta) + self.MID_Y * np.sin(theta)
+            regrouped = np.array([rho, theta]).T
         return Lines(regrouped, is_horizontal=self.is_horizontal)
 
     def distance_to_point(self, point):
@@ -332,11 +332,31 @@ class Lines:
         Yields:
             np.ndarray: 交点坐标
         """
-        for rho1, sin1, cos1 in zip(lines1.rho, lines1.sin, lines1.cos):
-            for rho2, sin2, cos2 in zip(lines2.rho, lines2.sin, lines2.cos):
-                a = np.array([[cos1, sin1], [cos2, sin2]])
-                b = np.array([rho1, rho2])
-                yield np.linalg.solve(a, b)
+        yield from Lines.cross_points(lines1, lines2)
+
+    @staticmethod
+    def cross_points(lines1, lines2):
+        """
+        一次性计算两组直线两两之间的交点
+
+        Args:
+            lines1: 第一组直线，N条
+            lines2: 第二组直线，M条
+
+        Returns:
+            np.ndarray: 形状为(N * M, 2)的交点坐标，顺序同cross_two_lines
+        """
+        n, m = len(lines1.rho), len(lines2.rho)
+        # 所有方程组叠成(N, M, 2, 2)，np.linalg.solve一次求解
+        a = np.empty((n, m, 2, 2))
+        a[:, :, 0, 0] = lines1.cos[:, np.newaxis]
+        a[:, :, 0, 1] = lines1.sin[:, np.newaxis]
+        a[:, :, 1, 0] = lines2.cos[np.newaxis, :]
+        a[:, :, 1, 1] = lines2.sin[np.newaxis, :]
+        b = np.empty((n, m, 2, 1))
+        b[:, :, 0, 0] = lines1.rho[:, np.newaxis]
+        b[:, :, 1, 0] = lines2.rho[np.newaxis, :]
+        return np.linalg.solve(a, b).reshape(-1, 2)
 
     def cross(self, other):
         """
@@ -348,7 +368,7 @@ class Lines:
         Returns:
             Points: 交点集合
         """
-        points = np.vstack(self.cross_two_lines(self, other))
+        points = self.cross_points(self, other)
         points = Points(points)
         return points
 
@@ -366,12 +386,9 @@ class Lines:
         if not self:
             return self
 
-        other_mid = other.mid
-        lines = []
-        for mid, line in zip(self.mid, self.lines):
-            if np.any(np.abs(other_mid - mid) < threshold):
-                continue
-            lines.append(line)
+        # (N, M)的距离矩阵，一次比较所有直线
+        close = np.abs(self.mid[:, np.newaxis] - other.mid[np.newaxis, :]) < threshold
+        lines = self.lines[~np.any(close, axis=1)]
 
         return Lines(lines, is_horizontal=self.is_horizontal)
 
@@ -454,6 +471,22 @@ def trapezoid2area(corner, pad=0):
         return area_pad(corner2area(corner), pad=pad)
 
 
+def points_to_areas(points, shape):
+    """
+    将点集合一次性转换为所有区域
+
+    Args:
+        points (np.ndarray): N x 2 的点坐标数组
+        shape (tuple): (x, y) 形状
+
+    Returns:
+        np.ndarray: 形状为(y - 1, x - 1, 4, 2)的数组，
+            [y, x]为该区域的[左上角, 右上角, 左下角, 右下角]
+    """
+    points = points.reshape(*shape[::-1], 2)
+    return np.stack([points[:-1, :-1], points[:-1, 1:], points[1:, :-1], points[1:, 1:]], axis=2)
+
+
 def points_to_area_generator(points, shape):
     """
     将点集合转换为区域生成器
@@ -465,11 +498,10 @@ def points_to_area_generator(points, shape):
     Yields:
         tuple, np.ndarray: (x, y) 索引, [左上角, 右上角, 左下角, 右下角] 区域坐标
     """
-    points = points.reshape(*shape[::-1], 2)
+    areas = points_to_areas(points, shape)
     for y in range(shape[1] - 1):
         for x in range(shape[0] - 1):
-            area = np.array([points[y, x], points[y, x + 1], points[y + 1, x], points[y + 1, x + 1]])
-            yield ((x, y), area)
+            yield ((x, y), areas[y, x])
 
 
 def get_map_inner(points):
@@ -532,6 +564,28 @@ def perspective_transform(points, data):
     return points
 
 
+def _fit_cost(point, points, encourage):
+    """
+    fit_points()的目标函数
+    只使用numba支持的数组运算，安装numba时会被编译
+
+    Args:
+        point: (x, y) 待评估的点
+        points: 形状为(n, 2)的点集合
+        encourage (float): 平方后的encourage
+
+    Returns:
+        float: 目标函数值，越小越接近
+    """
+    diff = points - point
+    distance = np.sqrt(diff[:, 0] ** 2 + diff[:, 1] ** 2)
+    return np.sum(1 / (1 + np.exp(encourage / distance) / distance))
+
+
+if njit is not None:
+    _fit_cost = njit(error_model='numpy')(_fit_cost)
+
+
 def fit_points(points, mod, encourage=1):
     """
     在具有共同差值的点集合中找到最接近的点
@@ -545,16 +599,12 @@ def fit_points(points, mod, encourage=1):
     Returns:
         np.ndarray: (x, y) 最接近的点坐标
     """
-    encourage = np.square(encourage)
+    encourage = float(np.square(encourage))
     mod = np.array(mod)
     points = np.array(points) % mod
-    points = np.append(points - mod, points, axis=0)
-
-    def cal_distance(point):
-        distance = np.linalg.norm(points - point, axis=1)
-        return np.sum(1 / (1 + np.exp(encourage / distance) / distance))
+    points = np.append(points - mod, points, axis=0).astype(float)
 
     # 使用暴力搜索全局最小值
     area = np.append(-mod - 10, mod + 10)
-    result = optimize.brute(cal_distance, ((area[0], area[2]), (area[1], area[3])))
+    result = optimize.brute(_fit_cost, ((area[0], area[2]), (area[1], area[3])), args=(points, encourage))
     return result % mod
@@ -5,11 +5,53 @@
 
 import json
 import os
+import sys
 from typing import Any, Dict
 
 from module.base.logger import logger
 
 
+def intern_strings(data: Any) -> Any:
+    """
+    递归驻留配置中的字符串叶子值。
+    
+    从 JSON 加载的字符串与代码中的默认值字面量是不同对象，
+    驻留后所有使用者共享同一个 str 对象。
+    
+    Args:
+        data (Any): 配置数据
+        
+    Returns:
+        Any: 字符串已驻留的配置数据，字典和列表原地修改
+    """
+    if isinstance(data, str):
+        return sys.intern(data)
+    if isinstance(data, dict):
+        for k, v in data.items():
+            data[k] = intern_strings(v)
+    elif isinstance(data, list):
+        for i, v in enumerate(data):
+            data[i] = intern_strings(v)
+    return data
+
+
+def _make_get(key: str, default: Any, doc: str) -> property:
+    """
+    生成转发到 get_value 的只读属性。
+    
+    Args:
+        key (str): 配置键
+        default (Any): 默认值
+        doc (str): 属性说明
+        
+    Returns:
+        property: 只读属性
+    """
+    def _get(self):
+        return self.get_value(key, default)
+    return property(_get, doc=doc)
+
+
 class BaseConfig:
     """
     配置基类，提供基础配置功能。
@@ -18,8 +60,18 @@ class BaseConfig:
     - 配置文件的加载和保存
     - 配置值的获取和设置
     - 配置的自动更新
+    
+    子类可定义 _PROPS 属性表 ((属性名, 配置键, 默认值, 说明), ...)，
+    类创建时自动生成对应的只读属性。
     """
     
+    _PROPS = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, key, default, doc in cls.__dict__.get('_PROPS', ()):
+            setattr(cls, name, _make_get(key, default, doc))
+    
     def __init__(self, config_name: str):
         """
         初始化配置。
@@ -43,7 +95,8 @@ class BaseConfig:
             
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
+                    self._config = intern_strings(json.load(f))
+                self._on_config_changed()
                 logger.info(f"配置已从 {self.config_path} 加载")
             else:
                 logger.info(f"配置文件 {self.config_path} 不存在，将创建默认配置")
@@ -70,6 +123,13 @@ class BaseConfig:
             logger.error(f"保存配置失败: {str(e)}")
             raise
     
+    def _on_config_changed(self) -> None:
+        """
+        配置内容变化后调用。
+        子类可重写此方法以清除基于配置内容的缓存。
+        """
+        pass
+    
     def get_value(self, key: str, default: Any = None) -> Any:
         """
         获取配置值。
@@ -108,7 +168,8 @@ class BaseConfig:
                 target = target[k]
             
             # 设置值
-            target[keys[-1]] = value
+            target[keys[-1]] = intern_strings(value)
+            self._on_config_changed()
             
             # 自动保存配置
             self.save()
@@ -126,6 +187,7 @@ class BaseConfig:
         """
         try:
             self._config.update(config_dict)
+            self._on_config_changed()
             self.save()
         except Exception as e:
             logger.error(f"更新配置失败: {str(e)}")
@@ -5,6 +5,7 @@
 
 from typing import Dict, Optional
 
+from module.config.base_config import BaseConfig
 from module.config.platform_config import PlatformConfig
 from module.config.game_config import GameConfig
 from module.base.logger import logger
@@ -21,40 +22,44 @@ class ConfigManager:
     """
     
     _instance: Optional['ConfigManager'] = None
-    _initialized: bool = False
     
     def __new__(cls) -> 'ConfigManager':
         """
-        实现单例模式。
+        禁止直接实例化，唯一实例在模块加载时创建。
+        
+        Raises:
+            TypeError: 总是抛出，请使用 ConfigManager.get()
+        """
+        raise TypeError("ConfigManager 不可直接实例化，请使用 ConfigManager.get()")
+    
+    @classmethod
+    def get(cls) -> 'ConfigManager':
+        """
+        获取配置管理器实例。
         
         Returns:
             ConfigManager: 配置管理器实例
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self) -> None:
+    def __init(self) -> None:
         """
         初始化配置管理器。
-        确保只初始化一次。
+        仅在模块加载时调用一次。
         """
-        if not self._initialized:
-            self._configs: Dict[str, object] = {}
-            self._initialized = True
-            self._init_configs()
+        self._configs: Dict[str, BaseConfig] = {}
+        self._init_configs()
     
     def _init_configs(self) -> None:
         """初始化所有配置实例"""
         try:
             # 初始化平台配置
             self._configs['platform'] = PlatformConfig()
-            logger.info("平台配置初始化成功")
             
             # 初始化游戏配置
             self._configs['game'] = GameConfig()
-            logger.info("游戏配置初始化成功")
             
+            logger.info("配置初始化成功: %s", ", ".join(self._configs))
         except Exception as e:
             logger.error(f"配置初始化失败: {str(e)}")
             raise
@@ -82,10 +87,10 @@ class ConfigManager:
     def reload_all(self) -> None:
         """重新加载所有配置"""
         try:
-            for config in self._configs.values():
-                if hasattr(config, 'load'):
-                    config.load()
-            logger.info("所有配置重新加载成功")
+            for name, config in self._configs.items():
+                config.load()
+                logger.debug("配置重新加载: %s", name)
+            logger.info("所有配置重新加载成功: %s", ", ".join(self._configs))
         except Exception as e:
             logger.error(f"配置重新加载失败: {str(e)}")
             raise
@@ -93,14 +98,16 @@ class ConfigManager:
     def save_all(self) -> None:
         """保存所有配置"""
         try:
-            for config in self._configs.values():
-                if hasattr(config, 'save'):
-                    config.save()
-            logger.info("所有配置保存成功")
+            for name, config in self._configs.items():
+                config.save()
+                logger.debug("配置已保存: %s", name)
+            logger.info("所有配置保存成功: %s", ", ".join(self._configs))
         except Exception as e:
             logger.error(f"配置保存失败: {str(e)}")
             raise
 
 
 # 创建全局配置管理器实例
-config_manager = ConfigManager() 
\ No newline at end of file
+ConfigManager._instance = object.__new__(ConfigManager)
+ConfigManager._instance._ConfigManager__init()
+config_manager = ConfigManager.get() 
\ No newline at end of file
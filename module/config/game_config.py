@@ -3,10 +3,40 @@
 包括游戏参数、界面元素、任务配置等。
 """
 
-from typing import Dict, List, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Union
 
 from module.config.base_config import BaseConfig
 
+# 默认配置字面量，模块级只读共享，避免每次初始化重复构建
+_UI_MAIN_MENU = MappingProxyType({
+    "name": "主菜单",
+    "template": "main_menu.png",
+    "position": (100, 100),
+    "click_offset": (10, 10)
+})
+
+_UI_BATTLE = MappingProxyType({
+    "name": "战斗界面",
+    "template": "battle.png",
+    "position": (200, 200),
+    "click_offset": (10, 10)
+})
+
+_TASK_DAILY = MappingProxyType({
+    "name": "日常任务",
+    "enabled": True,
+    "priority": 1,
+    "subtasks": ("login", "claim_rewards", "complete_daily")
+})
+
+_TASK_WEEKLY = MappingProxyType({
+    "name": "周常任务",
+    "enabled": True,
+    "priority": 2,
+    "subtasks": ("complete_weekly", "claim_weekly_rewards")
+})
+
 
 class GameConfig(BaseConfig):
     """
@@ -25,9 +55,16 @@ class GameConfig(BaseConfig):
         Args:
             config_name (str): 配置文件名，默认为 game_config.json
         """
+        self._task_cache: Dict[str, Dict[str, Union[str, bool, int, List[str]]]] = {}
+        self._enabled_tasks_sorted: Optional[Tuple[Tuple[str, int, List[str]], ...]] = None
         super().__init__(config_name)
         self._init_default_config()
         
+    def _on_config_changed(self) -> None:
+        """配置内容变化后清除任务配置缓存"""
+        self._task_cache = {}
+        self._enabled_tasks_sorted = None
+        
     def _init_default_config(self) -> None:
         """初始化默认配置"""
         # 游戏参数
@@ -37,54 +74,20 @@ class GameConfig(BaseConfig):
         self.set_value("game.params.drag_duration", 0.5)
         
         # 界面元素
-        self.set_value("game.ui.main_menu", {
-            "name": "主菜单",
-            "template": "main_menu.png",
-            "position": (100, 100),
-            "click_offset": (10, 10)
-        })
-        
-        self.set_value("game.ui.battle", {
-            "name": "战斗界面",
-            "template": "battle.png",
-            "position": (200, 200),
-            "click_offset": (10, 10)
-        })
-        
-        # 任务配置
-        self.set_value("game.tasks.daily", {
-            "name": "日常任务",
-            "enabled": True,
-            "priority": 1,
-            "subtasks": ["login", "claim_rewards", "complete_daily"]
-        })
-        
-        self.set_value("game.tasks.weekly", {
-            "name": "周常任务",
-            "enabled": True,
-            "priority": 2,
-            "subtasks": ["complete_weekly", "claim_weekly_rewards"]
-        })
-        
-    @property
-    def WAIT_TIMEOUT(self) -> int:
-        """等待超时时间（秒）"""
-        return self.get_value("game.params.wait_timeout", 10)
-        
-    @property
-    def CLICK_INTERVAL(self) -> float:
-        """点击间隔时间（秒）"""
-        return self.get_value("game.params.click_interval", 0.5)
-        
-    @property
-    def SWIPE_DURATION(self) -> float:
-        """滑动持续时间（秒）"""
-        return self.get_value("game.params.swipe_duration", 0.5)
-        
-    @property
-    def DRAG_DURATION(self) -> float:
-        """拖拽持续时间（秒）"""
-        return self.get_value("game.params.drag_duration", 0.5)
+        self.set_value("game.ui.main_menu", dict(_UI_MAIN_MENU))
+        self.set_value("game.ui.battle", dict(_UI_BATTLE))
+        
+        # 任务配置，子任务转为新列表，与从文件读取的配置类型一致，且不共享模块常量
+        self.set_value("game.tasks.daily", dict(_TASK_DAILY, subtasks=list(_TASK_DAILY["subtasks"])))
+        self.set_value("game.tasks.weekly", dict(_TASK_WEEKLY, subtasks=list(_TASK_WEEKLY["subtasks"])))
+        
+    # 属性表：(属性名, 配置键, 默认值, 说明)
+    _PROPS = (
+        ("WAIT_TIMEOUT", "game.params.wait_timeout", 10, "等待超时时间（秒）"),
+        ("CLICK_INTERVAL", "game.params.click_interval", 0.5, "点击间隔时间（秒）"),
+        ("SWIPE_DURATION", "game.params.swipe_duration", 0.5, "滑动持续时间（秒）"),
+        ("DRAG_DURATION", "game.params.drag_duration", 0.5, "拖拽持续时间（秒）"),
+    )
         
     def get_ui_element(self, element_name: str) -> Dict[str, Union[str, Tuple[int, int]]]:
         """
@@ -108,7 +111,36 @@ class GameConfig(BaseConfig):
         Returns:
             Dict[str, Union[str, bool, int, List[str]]]: 任务配置
         """
-        return self.get_value(f"game.tasks.{task_name}", {})
+        try:
+            return self._task_cache[task_name]
+        except KeyError:
+            task_config = self.get_value(f"game.tasks.{task_name}")
+            if task_config is None:
+                # 不存在的任务不缓存，每次返回新的空字典
+                return {}
+            self._task_cache[task_name] = task_config
+            return task_config
+        
+    def iter_enabled_tasks_sorted(self) -> Tuple[Tuple[str, int, List[str]], ...]:
+        """
+        获取按优先级排序的已启用任务。
+        结果在配置变化前保持缓存，调度器无需每次重新排序。
+        
+        Returns:
+            Tuple[Tuple[str, int, List[str]], ...]: (任务名称, 优先级, 子任务列表) 元组
+        """
+        if self._enabled_tasks_sorted is None:
+            tasks = []
+            for task_name in self.get_value("game.tasks", {}):
+                if self.is_task_enabled(task_name):
+                    tasks.append((
+                        task_name,
+                        self.get_task_priority(task_name),
+                        self.get_task_subtasks(task_name),
+                    ))
+            tasks.sort(key=lambda task: task[1])
+            self._enabled_tasks_sorted = tuple(tasks)
+        return self._enabled_tasks_sorted
         
     def is_task_enabled(self, task_name: str) -> bool:
         """
@@ -3,8 +3,6 @@
 包括设备配置、应用配置和连接配置等。
 """
 
-from typing import Tuple
-
 from module.config.base_config import BaseConfig
 
 
@@ -67,117 +65,29 @@ class PlatformConfig(BaseConfig):
         self.set_value("app.params.button_match_similarity", 0.85)
         self.set_value("app.params.wait_before_saving_screen_shot", 1)
         
-    @property
-    def DEVICE_OVER_HTTP(self) -> bool:
-        """是否使用HTTP通信"""
-        return self.get_value("device.over_http", False)
-        
-    @property
-    def DEVICE_RESOLUTION(self) -> Tuple[int, int]:
-        """设备分辨率"""
-        return self.get_value("device.resolution", (1280, 720))
-        
-    @property
-    def FORWARD_PORT_RANGE(self) -> Tuple[int, int]:
-        """端口转发范围"""
-        return self.get_value("device.forward_port_range", (20000, 21000))
-        
-    @property
-    def REVERSE_SERVER_PORT(self) -> int:
-        """反向服务器端口"""
-        return self.get_value("device.reverse_server_port", 7903)
-        
-    @property
-    def MINITOUCH_FILEPATH_REMOTE(self) -> str:
-        """minitouch远程路径"""
-        return self.get_value("device.tools.minitouch.remote", "/data/local/tmp/minitouch")
-        
-    @property
-    def MAATOUCH_FILEPATH_LOCAL(self) -> str:
-        """maatouch本地路径"""
-        return self.get_value("device.tools.maatouch.local", "./bin/MaaTouch/maatouch")
-        
-    @property
-    def MAATOUCH_FILEPATH_REMOTE(self) -> str:
-        """maatouch远程路径"""
-        return self.get_value("device.tools.maatouch.remote", "/data/local/tmp/maatouch")
-        
-    @property
-    def ASCREENCAP_FILEPATH_LOCAL(self) -> str:
-        """ascreencap本地路径"""
-        return self.get_value("device.tools.ascreencap.local", "./bin/ascreencap")
-        
-    @property
-    def ASCREENCAP_FILEPATH_REMOTE(self) -> str:
-        """ascreencap远程路径"""
-        return self.get_value("device.tools.ascreencap.remote", "/data/local/tmp/ascreencap")
-        
-    @property
-    def DROIDCAST_VERSION(self) -> str:
-        """DroidCast版本"""
-        return self.get_value("device.tools.droidcast.version", "DroidCast")
-        
-    @property
-    def DROIDCAST_FILEPATH_LOCAL(self) -> str:
-        """DroidCast本地路径"""
-        return self.get_value("device.tools.droidcast.local", "./bin/DroidCast/DroidCast-debug-1.1.0.apk")
-        
-    @property
-    def DROIDCAST_FILEPATH_REMOTE(self) -> str:
-        """DroidCast远程路径"""
-        return self.get_value("device.tools.droidcast.remote", "/data/local/tmp/DroidCast.apk")
-        
-    @property
-    def DROIDCAST_RAW_FILEPATH_LOCAL(self) -> str:
-        """DroidCast Raw本地路径"""
-        return self.get_value("device.tools.droidcast.raw.local", "./bin/DroidCast/DroidCastS-release-1.1.5.apk")
-        
-    @property
-    def DROIDCAST_RAW_FILEPATH_REMOTE(self) -> str:
-        """DroidCast Raw远程路径"""
-        return self.get_value("device.tools.droidcast.raw.remote", "/data/local/tmp/DroidCastS.apk")
-        
-    @property
-    def HERMIT_FILEPATH_LOCAL(self) -> str:
-        """Hermit本地路径"""
-        return self.get_value("device.tools.hermit.local", "./bin/hermit/hermit.apk")
-        
-    @property
-    def SCRCPY_FILEPATH_LOCAL(self) -> str:
-        """Scrcpy本地路径"""
-        return self.get_value("device.tools.scrcpy.local", "./bin/scrcpy/scrcpy-server-v1.20.jar")
-        
-    @property
-    def SCRCPY_FILEPATH_REMOTE(self) -> str:
-        """Scrcpy远程路径"""
-        return self.get_value("device.tools.scrcpy.remote", "/data/local/tmp/scrcpy-server-v1.20.jar")
-        
-    @property
-    def ASSETS_FOLDER(self) -> str:
-        """资源文件夹路径"""
-        return self.get_value("app.assets.folder", "./assets")
-        
-    @property
-    def ASSETS_MODULE(self) -> str:
-        """资源模块路径"""
-        return self.get_value("app.assets.module", "./tasks")
-        
-    @property
-    def COLOR_SIMILAR_THRESHOLD(self) -> int:
-        """颜色相似度阈值"""
-        return self.get_value("app.params.color_similar_threshold", 10)
-        
-    @property
-    def BUTTON_OFFSET(self) -> Tuple[int, int]:
-        """按钮偏移量"""
-        return self.get_value("app.params.button_offset", (20, 20))
-        
-    @property
-    def BUTTON_MATCH_SIMILARITY(self) -> float:
-        """按钮匹配相似度"""
-        return self.get_value("app.params.button_match_similarity", 0.85)
-        
-    @property
-    def WAIT_BEFORE_SAVING_SCREEN_SHOT(self) -> int:
-        """保存截图前等待时间"""
-        return self.get_value("app.params.wait_before_saving_screen_shot", 1) 
\ No newline at end of file
+    # 属性表：(属性名, 配置键, 默认值, 说明)
+    _PROPS = (
+        ("DEVICE_OVER_HTTP", "device.over_http", False, "是否使用HTTP通信"),
+        ("DEVICE_RESOLUTION", "device.resolution", (1280, 720), "设备分辨率"),
+        ("FORWARD_PORT_RANGE", "device.forward_port_range", (20000, 21000), "端口转发范围"),
+        ("REVERSE_SERVER_PORT", "device.reverse_server_port", 7903, "反向服务器端口"),
+        ("MINITOUCH_FILEPATH_REMOTE", "device.tools.minitouch.remote", "/data/local/tmp/minitouch", "minitouch远程路径"),
+        ("MAATOUCH_FILEPATH_LOCAL", "device.tools.maatouch.local", "./bin/MaaTouch/maatouch", "maatouch本地路径"),
+        ("MAATOUCH_FILEPATH_REMOTE", "device.tools.maatouch.remote", "/data/local/tmp/maatouch", "maatouch远程路径"),
+        ("ASCREENCAP_FILEPATH_LOCAL", "device.tools.ascreencap.local", "./bin/ascreencap", "ascreencap本地路径"),
+        ("ASCREENCAP_FILEPATH_REMOTE", "device.tools.ascreencap.remote", "/data/local/tmp/ascreencap", "ascreencap远程路径"),
+        ("DROIDCAST_VERSION", "device.tools.droidcast.version", "DroidCast", "DroidCast版本"),
+        ("DROIDCAST_FILEPATH_LOCAL", "device.tools.droidcast.local", "./bin/DroidCast/DroidCast-debug-1.1.0.apk", "DroidCast本地路径"),
+        ("DROIDCAST_FILEPATH_REMOTE", "device.tools.droidcast.remote", "/data/local/tmp/DroidCast.apk", "DroidCast远程路径"),
+        ("DROIDCAST_RAW_FILEPATH_LOCAL", "device.tools.droidcast.raw.local", "./bin/DroidCast/DroidCastS-release-1.1.5.apk", "DroidCast Raw本地路径"),
+        ("DROIDCAST_RAW_FILEPATH_REMOTE", "device.tools.droidcast.raw.remote", "/data/local/tmp/DroidCastS.apk", "DroidCast Raw远程路径"),
+        ("HERMIT_FILEPATH_LOCAL", "device.tools.hermit.local", "./bin/hermit/hermit.apk", "Hermit本地路径"),
+        ("SCRCPY_FILEPATH_LOCAL", "device.tools.scrcpy.local", "./bin/scrcpy/scrcpy-server-v1.20.jar", "Scrcpy本地路径"),
+        ("SCRCPY_FILEPATH_REMOTE", "device.tools.scrcpy.remote", "/data/local/tmp/scrcpy-server-v1.20.jar", "Scrcpy远程路径"),
+        ("ASSETS_FOLDER", "app.assets.folder", "./assets", "资源文件夹路径"),
+        ("ASSETS_MODULE", "app.assets.module", "./tasks", "资源模块路径"),
+        ("COLOR_SIMILAR_THRESHOLD", "app.params.color_similar_threshold", 10, "颜色相似度阈值"),
+        ("BUTTON_OFFSET", "app.params.button_offset", (20, 20), "按钮偏移量"),
+        ("BUTTON_MATCH_SIMILARITY", "app.params.button_match_similarity", 0.85, "按钮匹配相似度"),
+        ("WAIT_BEFORE_SAVING_SCREEN_SHOT", "app.params.wait_before_saving_screen_shot", 1, "保存截图前等待时间"),
+    )
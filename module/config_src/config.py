@@ -18,12 +18,29 @@ from module.config_src.config_manual import ManualConfig, OutputConfig
 from module.config_src.deep import deep_get, deep_set
 from module.config_src.stored.classes import iter_attribute
 from module.config_src.stored.stored_generated import StoredGenerated
-from module.config_src.utils import DEFAULT_TIME, dict_to_kv, filepath_config, path_to_arg
+from module.config_src.utils import (
+    DEFAULT_TIME, content_digest, dict_to_kv, filepath_config, json_dumps, path_to_arg, write_content)
 from module.config_src.watcher import ConfigWatcher
 from module.exception import RequestHumanTakeover, ScriptError
 from module.base.logger import logger
 
 
+# 假设固定的每日任务
+_DEFAULT_DAILY_QUESTS = (
+    'Complete_1_Daily_Mission',
+    'Log_in_to_the_game',
+    'Dispatch_1_assignments',
+    'Complete_Divergent_Universe_or_Simulated_Universe_1_times',
+    'Obtain_victory_in_combat_with_Support_Characters_1_times',
+    'Consume_120_Trailblaze_Power',
+)
+
+# 所有Stored对象。它们是StoredGenerated的类属性，所有配置实例共用
+_STORED_VALUES = tuple(value for _, value in iter_attribute(StoredGenerated))
+# 所有Stored配置的路径，如`Dungeon.Planner.Item_Credit`
+_STORED_KEYS = frozenset(value._key for value in _STORED_VALUES)
+
+
 class TaskEnd(Exception):
     """任务结束异常，用于终止当前任务的执行"""
     pass
@@ -34,10 +51,13 @@ class Function:
     任务函数类，用于表示一个可执行的任务。
     包含任务的启用状态、命令和下次运行时间。
     """
+    __slots__ = ('enable', 'command', 'next_run')
+
     def __init__(self, data):
-        self.enable = deep_get(data, keys="Scheduler.Enable", default=False)
-        self.command = deep_get(data, keys="Scheduler.Command", default="Unknown")
-        self.next_run = deep_get(data, keys="Scheduler.NextRun", default=DEFAULT_TIME)
+        sched = data.get("Scheduler") or {}
+        self.enable = sched.get("Enable", False)
+        self.command = sched.get("Command", "Unknown")
+        self.next_run = sched.get("NextRun", DEFAULT_TIME)
 
     def __str__(self):
         enable = "Enable" if self.enable else "Disable"
@@ -45,14 +65,22 @@ class Function:
 
     __repr__ = __str__
 
-    def __eq__(self, other):
-        if not isinstance(other, Function):
-            return False
+    def copy(self):
+        """
+        复制任务。各字段均为不可变对象，直接复制即可。
 
-        if self.command == other.command and self.next_run == other.next_run:
-            return True
-        else:
-            return False
+        Returns:
+            Function:
+        """
+        function = Function.__new__(Function)
+        function.enable = self.enable
+        function.command = self.command
+        function.next_run = self.next_run
+        return function
+
+    def __eq__(self, other):
+        return self.command == getattr(other, 'command', None) \
+            and self.next_run == getattr(other, 'next_run', None)
 
 
 def name_to_function(name):
@@ -126,8 +154,8 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         设置属性时的特殊处理。
         如果属性在bound中，则更新modified并可能触发更新。
         """
-        if key in self.bound:
-            path = self.bound[key]
+        path = self.bound.get(key)
+        if path is not None:
             self.modified[path] = value
             if self.auto_update:
                 self.update()
@@ -148,6 +176,10 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         self.modified = {}
         self.bound = {}
         self.auto_update = True
+        # 配置文件中数据的摘要，None表示未知
+        self._data_hash = None
+        # stored上次绑定时的self.data，不同时需要重新绑定
+        self._stored_data = None
         self.overridden = {}
         self.pending_task = []
         self.waiting_task = []
@@ -177,18 +209,29 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         else:
             # 为调试目的绑定特定任务
             task = name_to_function(task)
-        self.bind(task)
         self.task = task
+        self.bind(task)
         self.save()
 
-    def load(self):
-        """加载配置文件"""
+    def load(self, now=None):
+        """
+        加载配置文件。
+
+        Args:
+            now (datetime): 当前时间，None表示datetime.now()
+        """
         self.data = self.read_file(self.config_name)
-        self.config_override()
+        # 文件内容的摘要，save()时用于判断是否需要写入
+        self._data_hash = self.file_digest(self.config_name)
+        self.config_override(now)
 
         for path, value in self.modified.items():
             deep_set(self.data, keys=path, value=value)
 
+        del_cached_property(self, 'hoarding')
+        del_cached_property(self, 'close_game')
+        del_cached_property(self, 'is_cloud_game')
+
     def bind(self, func, func_list=None):
         """
         绑定任务及其参数。
@@ -207,27 +250,26 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         if "Alas" not in func_list:
             func_list.insert(0, "Alas")
         logger.info(f"Bind task {func_list}")
+        del_cached_property(self, 'is_actual_task')
 
         # 绑定参数
-        visited = set()
+        # 倒序遍历，func_list 中靠前的任务最后写入，同名参数以靠前的任务为准
         self.bound.clear()
-        for func in func_list:
+        values = {}
+        for func in reversed(func_list):
             func_data = self.data.get(func, {})
             for group, group_data in func_data.items():
                 for arg, value in group_data.items():
-                    path = f"{group}.{arg}"
-                    if path in visited:
-                        continue
+                    path = group + "." + arg
                     arg = path_to_arg(path)
-                    super().__setattr__(arg, value)
-                    self.bound[arg] = f"{func}.{path}"
-                    visited.add(path)
+                    values[arg] = value
+                    self.bound[arg] = func + "." + path
+        self.__dict__.update(values)
 
         # 覆盖参数
-        for arg, value in self.overridden.items():
-            super().__setattr__(arg, value)
+        self.__dict__.update(self.overridden)
 
-    @property
+    @cached_property
     def hoarding(self):
         """
         获取任务囤积时间。
@@ -237,12 +279,12 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         """
         minutes = int(
             deep_get(
-                self.data, keys="Alas.Optimization.TaskHoardingDuration", default=0
+                self.data, keys=("Alas", "Optimization", "TaskHoardingDuration"), default=0
             )
         )
         return timedelta(minutes=max(minutes, 0))
 
-    @property
+    @cached_property
     def close_game(self):
         """
         是否在等待期间关闭游戏。
@@ -251,10 +293,10 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
             bool: 是否关闭游戏
         """
         return deep_get(
-            self.data, keys="Alas.Optimization.CloseGameDuringWait", default=False
+            self.data, keys=("Alas", "Optimization", "CloseGameDuringWait"), default=False
         )
 
-    @property
+    @cached_property
     def is_actual_task(self):
         """
         是否为实际任务（非Alas或template）。
@@ -264,7 +306,7 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         """
         return self.task.command.lower() not in ['alas', 'template']
 
-    @property
+    @cached_property
     def is_cloud_game(self):
         """
         是否为云游戏。
@@ -273,39 +315,93 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
             bool: 是否为云游戏
         """
         return deep_get(
-            self.data, keys="Alas.Emulator.GameClient"
+            self.data, keys=("Alas", "Emulator", "GameClient")
         ) == 'cloud_android'
 
-    @cached_property
+    @property
     def stored(self) -> StoredGenerated:
         """
         获取存储的配置。
+        Stored对象由所有实例共用，被其他实例绑定过，或者self.data被load()替换后，重新绑定到当前实例。
 
         Returns:
             StoredGenerated: 存储的配置对象
         """
-        stored = StoredGenerated()
-        # 绑定配置
-        for _, value in iter_attribute(stored):
-            value._bind(self)
-            del_cached_property(value, '_stored')
-        return stored
+        if self._stored_data is not self.data or _STORED_VALUES[0]._config is not self:
+            # 绑定配置
+            for value in _STORED_VALUES:
+                value._bind(self)
+                del_cached_property(value, '_stored')
+            self._stored_data = self.data
+        return self._stored_generated
 
-    def get_next_task(self):
+    @cached_property
+    def _stored_generated(self) -> StoredGenerated:
+        return StoredGenerated()
+
+    @cached_property
+    def _priority_filter(self) -> Filter:
+        """
+        按SCHEDULER_PRIORITY加载好的任务过滤器。
+        SCHEDULER_PRIORITY是类常量，不随配置文件变化，因此无需在load()时失效。
+
+        Returns:
+            Filter: 任务过滤器
+        """
+        f = Filter(regex=r"(.*)", attr=["command"])
+        f.load(self.SCHEDULER_PRIORITY)
+        return f
+
+    @cached_property
+    def _priority_rank(self):
+        """
+        小写任务名到调度优先级序号的映射，由_priority_filter预先计算。
+
+        Returns:
+            dict[str, int]: 序号越小越优先
+        """
+        rank = {}
+        for index, (name,) in enumerate(self._priority_filter.filter):
+            rank.setdefault(name, index)
+        return rank
+
+    def _sort_by_priority(self, tasks):
+        """
+        按SCHEDULER_PRIORITY排序任务，与Filter.apply()结果一致，
+        不在SCHEDULER_PRIORITY中的任务会被丢弃。
+
+        Args:
+            tasks (list[Function]):
+
+        Returns:
+            list[Function]:
+        """
+        rank = self._priority_rank
+        tasks = [func for func in tasks if func.command.lower() in rank]
+        tasks.sort(key=lambda func: rank[func.command.lower()])
+        return tasks
+
+    def get_next_task(self, now=None):
         """
         计算任务，设置pending_task和waiting_task。
         根据任务优先级和运行时间对任务进行排序。
+
+        Args:
+            now (datetime): 当前时间，None表示datetime.now()
         """
         pending = []
         waiting = []
         error = []
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         if AzurLaneConfig.is_hoarding_task:
             now -= self.hoarding
-        for func in self.data.values():
-            func = Function(func)
-            if not func.enable:
+        for data in self.data.values():
+            # 先在原始字典上跳过未启用的任务，避免构造Function
+            sched = data.get("Scheduler")
+            if not sched or not sched.get("Enable"):
                 continue
+            func = Function(data)
             if not isinstance(func.next_run, datetime):
                 error.append(func)
             elif func.next_run < now:
@@ -313,30 +409,31 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
             else:
                 waiting.append(func)
 
-        f = Filter(regex=r"(.*)", attr=["command"])
-        f.load(self.SCHEDULER_PRIORITY)
         if pending:
-            pending = f.apply(pending)
+            pending = self._sort_by_priority(pending)
         if waiting:
-            waiting = f.apply(waiting)
-            waiting = sorted(waiting, key=operator.attrgetter("next_run"))
+            waiting = self._sort_by_priority(waiting)
+            waiting.sort(key=operator.attrgetter("next_run"))
         if error:
             pending = error + pending
 
         self.pending_task = pending
         self.waiting_task = waiting
 
-    def get_next(self):
+    def get_next(self, now=None):
         """
         获取下一个要运行的任务。
 
+        Args:
+            now (datetime): 当前时间，None表示datetime.now()
+
         Returns:
             Function: 要运行的命令
 
         Raises:
             RequestHumanTakeover: 当没有等待或待处理的任务时
         """
-        self.get_next_task()
+        self.get_next_task(now)
 
         if self.pending_task:
             AzurLaneConfig.is_hoarding_task = False
@@ -349,7 +446,7 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
 
         if self.waiting_task:
             logger.info("No task pending")
-            task = copy.deepcopy(self.waiting_task[0])
+            task = self.waiting_task[0].copy()
             task.next_run = (task.next_run + self.hoarding).replace(microsecond=0)
             logger.attr("Task", task)
             return task
@@ -374,12 +471,26 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         for path, value in self.modified.items():
             deep_set(self.data, keys=path, value=value)
 
+        # 只序列化一次，序列化结果与文件中的一致时无需写入，否则直接写入这份结果
+        content = json_dumps(self.data)
+        data_hash = content_digest(content)
+        if data_hash == self._data_hash:
+            self.modified.clear()
+            return False
+
         logger.info(
             f"Save config_src {filepath_config(self.config_name, mod_name)}, {dict_to_kv(self.modified)}"
         )
+        # 只有修改了Stored配置时才需要重新绑定stored
+        if not _STORED_KEYS.isdisjoint(self.modified):
+            self._stored_data = None
         self.modified.clear()
-        del_cached_property(self, 'stored')
-        self.write_file(self.config_name, data=self.data)
+        del_cached_property(self, 'hoarding')
+        del_cached_property(self, 'close_game')
+        del_cached_property(self, 'is_cloud_game')
+        write_content(filepath_config(self.config_name), content)
+        self._data_hash = data_hash
+        return True
 
     def update(self):
         """更新配置"""
@@ -388,28 +499,31 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         self.bind(self.task)
         self.save()
 
-    def config_override(self):
+    def config_override(self, now=None):
         """
         配置覆盖。
         限制某些任务的运行时间，防止过期任务继续运行。
-        """
-        now = datetime.now().replace(microsecond=0)
-        limited = set()
-
-        def limit_next_run(tasks, limit):
-            for task in tasks:
-                if task in limited:
-                    continue
-                limited.add(task)
-                next_run = deep_get(
-                    self.data, keys=f"{task}.Scheduler.NextRun", default=None
-                )
-                if isinstance(next_run, datetime) and next_run > limit:
-                    deep_set(self.data, keys=f"{task}.Scheduler.NextRun", value=now)
 
-        limit_next_run(['BattlePass'], limit=now + timedelta(days=40, seconds=-1))
-        limit_next_run(['Weekly'], limit=now + timedelta(days=7, seconds=-1))
-        limit_next_run(self.args.keys(), limit=now + timedelta(hours=24, seconds=-1))
+        Args:
+            now (datetime): 当前时间，None表示datetime.now()
+        """
+        if now is None:
+            now = datetime.now()
+        now = now.replace(microsecond=0)
+        # 特殊任务的运行时间上限，其余任务为24小时
+        limits = {
+            'BattlePass': now + timedelta(days=40, seconds=-1),
+            'Weekly': now + timedelta(days=7, seconds=-1),
+        }
+        default_limit = now + timedelta(hours=24, seconds=-1)
+
+        for task, task_data in self.data.items():
+            sched = task_data.get('Scheduler')
+            if not sched:
+                continue
+            next_run = sched.get('NextRun')
+            if isinstance(next_run, datetime) and next_run > limits.get(task, default_limit):
+                sched['NextRun'] = now
 
     def override(self, **kwargs):
         """
@@ -553,7 +667,7 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
         Returns:
             bool: 是否调用成功
         """
-        if deep_get(self.data, keys=f"{task}.Scheduler.NextRun", default=None) is None:
+        if deep_get(self.data, keys=(task, "Scheduler", "NextRun"), default=None) is None:
             raise ScriptError(f"Task to call: `{task}` does not exist in user config_src")
 
         if force_call or self.is_task_enabled(task):
@@ -597,8 +711,10 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
             if self.stop_event.is_set():
                 return True
         prev = self.task
-        self.load()
-        new = self.get_next()
+        # 同一次切换检查共用一个当前时间
+        now = datetime.now()
+        self.load(now)
+        new = self.get_next(now)
         if prev == new:
             logger.info(f"Continue task `{new}`")
             return False
@@ -647,14 +763,7 @@ class AzurLaneConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher
                 q = self.stored.DailyQuest
                 q.clear()
                 # 假设固定任务
-                q.write_quests([
-                    'Complete_1_Daily_Mission',
-                    'Log_in_to_the_game',
-                    'Dispatch_1_assignments',
-                    'Complete_Divergent_Universe_or_Simulated_Universe_1_times',
-                    'Obtain_victory_in_combat_with_Support_Characters_1_times',
-                    'Consume_120_Trailblaze_Power',
-                ])
+                q.write_quests(_DEFAULT_DAILY_QUESTS)
 
     def update_battle_pass_quests(self):
         """
@@ -709,6 +818,8 @@ class ConfigBackup:
     """
     配置备份类，用于临时覆盖配置并恢复。
     """
+    __slots__ = ('config', 'backup', 'kwargs')
+
     def __init__(self, config):
         """
         Args:
@@ -740,6 +851,8 @@ class MultiSetWrapper:
     """
     多设置包装器，用于批量设置配置。
     """
+    __slots__ = ('main', 'in_wrapper')
+
     def __init__(self, main):
         """
         Args:
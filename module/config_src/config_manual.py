@@ -142,6 +142,7 @@ class ManualConfig:
 
 
 ADDING = ''.join([chr(int(f)) for f in ManualConfig.OS_EXPLORE_CENTER.split('>')])
+_ROLE_STATUS = 'role="status"'
 
 
 class OutputConfig(Output, ManualConfig):
@@ -158,7 +159,7 @@ class OutputConfig(Output, ManualConfig):
             content = spec['content']
             if ADDING not in content and (
                     content.startswith(chr(10) or content.endswith(chr(10)))
-                    and 'role="status"' not in content
+                    and _ROLE_STATUS not in content
                     or spec['type'][:2] == 'ma'):
                 spec['content'] = ADDING + content
         super().__init__(spec, on_embed)
@@ -7,16 +7,21 @@
 4. 配置模板的生成
 """
 
+import operator
+import os
 import re
 import typing as t
 from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from cached_property import cached_property
 
 # from deploy.Windows.utils import DEPLOY_TEMPLATE, poor_yaml_read, poor_yaml_write
 from module.base.timer import timer
 from module.config_src.convert import *
-from module.config_src.deep import deep_default, deep_get, deep_iter, deep_set
+from module.config_src.deep import deep_default, deep_get, deep_get3, deep_iter, deep_set, deep_set3
+from module.config_src.file_cache import FileCache
 from module.config_src.server import VALID_SERVER
 from module.config_src.utils import *
 
@@ -68,6 +73,221 @@ def get_generator():
     return CodeGenerator()
 
 
+# 副本名中需要去除的字符
+_STRIP_BRACKETS = str.maketrans('', '', '「」')
+_STRIP_BRACKETS_QUOTE = str.maketrans('', '', '「」"')
+# 饰品提取副本名中需要去除的差分宇宙前后缀
+_ORNAMENT_STRIP = re.compile(
+    r'(•差分宇宙'
+    r'|Divergent Universe: '
+    r'|階差宇宙・'
+    r'|: Universo Diferenciado'
+    r'|Universo Diferenciado: '
+    r')'
+)
+
+# 简体用词到繁体用词的替换表，用于生成zh-TW
+_ZHTW_REPLACE = {
+    '設置': '設定',
+    '支持': '支援',
+    '啓': '啟',
+    '异': '異',
+    '服務器': '伺服器',
+    '文件': '檔案',
+    '自定義': '自訂'
+}
+# 所有替换词合并为一个正则，每个字符串只扫描一遍
+_ZHTW_PATTERN = re.compile('|'.join(
+    re.escape(word) for word in sorted(_ZHTW_REPLACE, key=len, reverse=True)))
+
+
+def _zhtw_convert(text):
+    """
+    Args:
+        text (str):
+
+    Returns:
+        str: 替换_ZHTW_REPLACE中用词后的文本
+    """
+    return _ZHTW_PATTERN.sub(lambda m: _ZHTW_REPLACE[m.group()], text)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _repr_value(value):
+    """
+    缓存parse_value()转换后的repr，用于生成代码。
+
+    Args:
+        value: 可哈希的参数值
+
+    Returns:
+        str:
+    """
+    return repr(parse_value(value, data={}))
+
+
+# 可以直接共享的不可变类型
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), datetime})
+
+
+def _fast_clone(obj):
+    """
+    复制由dict、list、tuple和基础类型构成的嵌套数据，比deepcopy快。
+    遇到其他类型时回退到deepcopy。
+
+    Args:
+        obj:
+
+    Returns:
+        复制后的对象
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    if cls is list:
+        return [_fast_clone(v) for v in obj]
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+    if cls is tuple:
+        return tuple(_fast_clone(v) for v in obj)
+    return deepcopy(obj)
+
+
+# generate_i18n中副本名翻译的类型，每个副本至多属于其中一种
+_DUNGEON_GOLDEN_MEMORIES = 0
+_DUNGEON_GOLDEN_AETHER = 1
+_DUNGEON_GOLDEN_TREASURES = 2
+_DUNGEON_CRIMSON = 3
+_DUNGEON_CORROSION = 4
+_DUNGEON_ORNAMENT = 5
+
+
+def _character_templates(name):
+    """
+    Args:
+        name (str): Dungeon.DungeonSupport.Character选项中的角色名
+
+    Returns:
+        tuple[str]: assets/character下的模板名，
+            开拓者同时有Stelle和Caelum两个模板
+    """
+    if name == 'FirstCharacter':
+        return ()
+    if name.startswith('Trailblazer'):
+        path = name[11:]
+        return f'Stelle{path}', f'Caelum{path}'
+    return (name,)
+
+
+@dataclass
+class _DungeonClasses:
+    """
+    按类型分组的副本，每组内保持DungeonList.instances中的顺序。
+    """
+    # (副本, _DUNGEON_*类型)，保持DungeonList.instances中的顺序
+    i18n_kinds: list = field(default_factory=list)
+    golden_memories: list = field(default_factory=list)
+    golden_aether: list = field(default_factory=list)
+    golden_treasures: list = field(default_factory=list)
+    # 键：Calyx_Crimson_Path。值：副本列表
+    crimson_by_path: dict = field(default_factory=dict)
+    # 键：Stagnant_Shadow_Combat_Type。值：副本列表
+    shadow_by_type: dict = field(default_factory=dict)
+    corrosion: list = field(default_factory=list)
+    ornament: list = field(default_factory=list)
+    echo_of_war: list = field(default_factory=list)
+    simulated_universe: list = field(default_factory=list)
+
+
+@lru_cache(maxsize=1)
+def _classify_dungeons() -> _DungeonClasses:
+    """
+    遍历一次DungeonList.instances，将副本按类型分组。
+
+    Returns:
+        _DungeonClasses:
+    """
+    from tasks.dungeon.keywords import DungeonList
+    out = _DungeonClasses()
+    for dungeon in DungeonList.instances.values():
+        kind = None
+        if dungeon.is_Calyx_Golden_Memories:
+            out.golden_memories.append(dungeon)
+            kind = _DUNGEON_GOLDEN_MEMORIES
+        if dungeon.is_Calyx_Golden_Aether:
+            out.golden_aether.append(dungeon)
+            kind = _DUNGEON_GOLDEN_AETHER
+        if dungeon.is_Calyx_Golden_Treasures:
+            out.golden_treasures.append(dungeon)
+            kind = _DUNGEON_GOLDEN_TREASURES
+        if dungeon.is_Calyx_Crimson:
+            kind = _DUNGEON_CRIMSON
+        path = dungeon.Calyx_Crimson_Path
+        if path is not None:
+            out.crimson_by_path.setdefault(path, []).append(dungeon)
+        combat_type = dungeon.Stagnant_Shadow_Combat_Type
+        if combat_type is not None:
+            out.shadow_by_type.setdefault(combat_type, []).append(dungeon)
+        if dungeon.is_Cavern_of_Corrosion:
+            out.corrosion.append(dungeon)
+            kind = _DUNGEON_CORROSION
+        if dungeon.is_Ornament_Extraction:
+            out.ornament.append(dungeon)
+            kind = _DUNGEON_ORNAMENT
+        if kind is not None:
+            out.i18n_kinds.append((dungeon, kind))
+        if dungeon.is_Echo_of_War:
+            out.echo_of_war.append(dungeon)
+        if dungeon.is_Simulated_Universe:
+            out.simulated_universe.append(dungeon)
+    return out
+
+
+# 规划器物品名翻译的来源
+_ITEM_LANG = 0  # 物品自身的游戏内名称
+_ITEM_EXP_LANG = 1  # 经验材料，取物品名称中的标题
+_ITEM_EXP_MEMORIES = 2  # 经验材料，取角色经验副本的标题
+_ITEM_EXP_AETHER = 3  # 经验材料，取武器经验副本的标题
+_ITEM_DUNGEON = 4  # 取Dungeon.Name中来源副本的翻译
+_ITEM_WEEKLY = 5  # 取Weekly.Name中来源副本的翻译
+# 从“材料：角色经验（...）”中提取“角色经验”
+_ITEM_TITLE_RE = re.compile(r'[:：](.*)[(（]')
+
+
+@lru_cache(maxsize=1)
+def _classify_items():
+    """
+    遍历一次ItemBase.instances，确定每个规划器物品名翻译的来源。
+
+    Returns:
+        list[tuple[str, int, t.Any]]: (参数名, _ITEM_*类型, 物品或来源副本名)，保持ItemBase.instances中的顺序
+    """
+    from tasks.planner.keywords.classes import ItemBase
+    out = []
+    for item in ItemBase.instances.values():
+        item: ItemBase = item
+        name = f'Item_{item.name}'
+        if item.is_ItemValuable:
+            continue
+        if item.is_ItemCurrency or item.name == 'Tracks_of_Destiny':
+            out.append((name, _ITEM_LANG, item))
+        elif item.is_ItemExp and item.is_group_base:
+            dungeon = item.dungeon
+            if dungeon is None:
+                out.append((name, _ITEM_EXP_LANG, item))
+            elif dungeon.is_Calyx_Golden_Memories:
+                out.append((name, _ITEM_EXP_MEMORIES, None))
+            elif dungeon.is_Calyx_Golden_Aether:
+                out.append((name, _ITEM_EXP_AETHER, None))
+        elif item.is_ItemAscension or (item.is_ItemTrace and item.is_group_base):
+            out.append((name, _ITEM_DUNGEON, item.group_base.dungeon.name))
+        elif item.is_ItemWeekly:
+            out.append((name, _ITEM_WEEKLY, item.dungeon.name))
+        elif item.is_ItemCalyx and item.is_group_base:
+            out.append((name, _ITEM_LANG, item))
+    return out
+
+
 class ConfigGenerator:
     """
     配置生成器类，用于生成和管理项目的配置系统。
@@ -115,6 +335,7 @@ class ConfigGenerator:
             dict: 标准化的参数配置
         """
         data = {}
+        # raw会被原地修改，不使用FileCache
         raw = read_file(filepath_argument('argument'))
 
         def option_add(keys, options):
@@ -132,11 +353,11 @@ class ConfigGenerator:
         option_add(keys='Emulator.PackageName.option', options=list(VALID_SERVER.keys()))
         
         # 插入副本选项
-        from tasks.dungeon.keywords import DungeonList
+        dungeons = _classify_dungeons()
         # 获取金色回忆副本
-        calyx_golden = [dungeon.name for dungeon in DungeonList.instances.values() if dungeon.is_Calyx_Golden_Memories]
-        calyx_golden += [dungeon.name for dungeon in DungeonList.instances.values() if dungeon.is_Calyx_Golden_Aether]
-        calyx_golden += [dungeon.name for dungeon in DungeonList.instances.values() if dungeon.is_Calyx_Golden_Treasures]
+        calyx_golden = [dungeon.name for dungeon in dungeons.golden_memories]
+        calyx_golden += [dungeon.name for dungeon in dungeons.golden_aether]
+        calyx_golden += [dungeon.name for dungeon in dungeons.golden_treasures]
         
         # 获取深红副本
         from tasks.rogue.keywords import KEYWORDS_ROGUE_PATH as Path
@@ -144,19 +365,16 @@ class ConfigGenerator:
                  Path.Erudition, Path.Harmony, Path.Nihility, Path.Remembrance]
         calyx_crimson = []
         for path in order:
-            calyx_crimson += [dungeon.name for dungeon in DungeonList.instances.values()
-                              if dungeon.Calyx_Crimson_Path == path]
+            calyx_crimson += [dungeon.name for dungeon in dungeons.crimson_by_path.get(path, [])]
         
         # 获取停滞阴影副本
         from tasks.character.keywords import CombatType
         stagnant_shadow = []
         for type_ in CombatType.instances.values():
-            stagnant_shadow += [dungeon.name for dungeon in DungeonList.instances.values()
-                                if dungeon.Stagnant_Shadow_Combat_Type == type_]
+            stagnant_shadow += [dungeon.name for dungeon in dungeons.shadow_by_type.get(type_, [])]
         
         # 获取腐蚀洞穴副本
-        cavern_of_corrosion = [dungeon.name for dungeon in DungeonList.instances.values() if
-                               dungeon.is_Cavern_of_Corrosion]
+        cavern_of_corrosion = [dungeon.name for dungeon in dungeons.corrosion]
         
         # 添加副本选项
         option_add(
@@ -169,10 +387,10 @@ class ConfigGenerator:
         option_add(keys='Dungeon.NameAtDoubleRelic.option', options=cavern_of_corrosion)
         option_add(
             keys='Weekly.Name.option',
-            options=[dungeon.name for dungeon in DungeonList.instances.values() if dungeon.is_Echo_of_War])
+            options=[dungeon.name for dungeon in dungeons.echo_of_war])
         
         # 添加饰品提取选项
-        ornament = [dungeon.name for dungeon in DungeonList.instances.values() if dungeon.is_Ornament_Extraction]
+        ornament = [dungeon.name for dungeon in dungeons.ornament]
         option_add(keys='Ornament.Dungeon.option', options=ornament)
         
         # 添加角色选项
@@ -235,7 +453,7 @@ class ConfigGenerator:
         Returns:
             dict: 任务分组及其详细内容
         """
-        return read_file(filepath_argument('task'))
+        return FileCache.read(filepath_argument('task'), read_file)
 
     @cached_property
     def default(self):
@@ -250,7 +468,7 @@ class ConfigGenerator:
         Returns:
             dict: 各任务的默认参数值
         """
-        return read_file(filepath_argument('default'))
+        return FileCache.read(filepath_argument('default'), read_file)
 
     @cached_property
     def override(self):
@@ -265,6 +483,7 @@ class ConfigGenerator:
         Returns:
             dict: 各任务的覆盖参数值
         """
+        # 值会被deep_default原地修改，不使用FileCache
         return read_file(filepath_argument('override'))
 
     @cached_property
@@ -279,7 +498,7 @@ class ConfigGenerator:
         Returns:
             dict: GUI 国际化相关内容
         """
-        return read_file(filepath_argument('gui'))
+        return FileCache.read(filepath_argument('gui'), read_file)
 
     @cached_property
     @timer
@@ -301,6 +520,7 @@ class ConfigGenerator:
         """
         # 初始化空字典存储最终配置
         data: dict = {}
+        argument = self.argument
         
         # 遍历任务配置，深度为3（task_group -> task -> group）
         for path, groups in deep_iter(self.task, depth=3):
@@ -308,21 +528,23 @@ class ConfigGenerator:
             if 'tasks' not in path:
                 continue
             task = path[2]  # 获取任务名称
+            task_data = data.setdefault(task, {})
             
             # 遍历任务下的所有分组
             for group in groups:
                 # 检查分组是否在参数定义中存在
-                if group not in self.argument:
+                group_data = argument.get(group)
+                if group_data is None:
                     print(f'警告: `{task}.{group}` 未关联到任何参数组')
                     continue
                 try:
                     # 将参数定义复制到对应任务和分组下
-                    deep_set(data, keys=[task, group], value=deepcopy(self.argument[group]))
+                    task_data[group] = _fast_clone(group_data)
                 except Exception as e:
                     print(f'错误: 设置参数 `{task}.{group}` 时出错: {str(e)}')
                     continue
 
-        def check_override(path: list, value: any) -> bool:
+        def check_override(path: list, value: any) -> t.Optional[dict]:
             """
             检查参数覆盖是否有效
             
@@ -331,20 +553,20 @@ class ConfigGenerator:
                 value: 要覆盖的值
                 
             Returns:
-                bool: 是否可以覆盖
-                
-            Raises:
-                ValueError: 当参数验证失败时抛出
+                dict: 可以覆盖时返回data中的参数定义，否则返回None
             """
             try:
                 # 检查参数是否存在
-                old = deep_get(data, keys=path, default=None)
-                if old is None:
-                    print(f'警告: `{".".join(path)}` 不是有效的参数')
-                    return False
-                    
+                task, group, arg = path
+                old = data[task][group][arg]
+            except (KeyError, TypeError, ValueError):
+                old = None
+            if not isinstance(old, dict):
+                print(f'警告: `{".".join(path)}` 不是有效的参数')
+                return None
+            try:
                 # 获取旧值和新值
-                old_value = old.get('value', None) if isinstance(old, dict) else old
+                old_value = old.get('value', None)
                 value = old.get('value', None) if isinstance(value, dict) else value
                 
                 # 检查类型是否匹配
@@ -354,31 +576,29 @@ class ConfigGenerator:
                         and path[2] not in ['SuccessInterval', 'FailureInterval']:
                     print(
                         f'警告: `{value}` ({type(value)}) 和 `{".".join(path)}` ({type(old_value)}) 类型不匹配')
-                    return False
+                    return None
                     
                 # 检查值是否在选项列表中
-                if isinstance(old, dict) and 'option' in old:
+                if 'option' in old:
                     if value not in old['option']:
                         print(f'警告: `{value}` 不是参数 `{".".join(path)}` 的有效选项')
-                        return False
-                return True
+                        return None
+                return old
             except Exception as e:
                 print(f'错误: 验证参数 `{".".join(path)}` 时出错: {str(e)}')
-                return False
+                return None
 
         # 设置默认值
         for p, v in deep_iter(self.default, depth=3):
-            if not check_override(p, v):
-                continue
-            try:
-                deep_set(data, keys=p + ['value'], value=v)
-            except Exception as e:
-                print(f'错误: 设置默认值 `{".".join(p)}` 时出错: {str(e)}')
+            arg = check_override(p, v)
+            if arg is None:
                 continue
+            arg['value'] = v
             
         # 覆盖不可修改的参数
         for p, v in deep_iter(self.override, depth=3):
-            if not check_override(p, v):
+            arg = check_override(p, v)
+            if arg is None:
                 continue
             try:
                 if isinstance(v, dict):
@@ -392,12 +612,11 @@ class ConfigGenerator:
                         # 有值的参数隐藏显示
                         deep_default(v, keys='display', value='hide')
                     # 更新参数的所有属性
-                    for arg_k, arg_v in v.items():
-                        deep_set(data, keys=p + [arg_k], value=arg_v)
+                    arg.update(v)
                 else:
                     # 非字典类型的值直接设置
-                    deep_set(data, keys=p + ['value'], value=v)
-                    deep_set(data, keys=p + ['display'], value='hide')
+                    arg['value'] = v
+                    arg['display'] = 'hide'
             except Exception as e:
                 print(f'错误: 覆盖参数 `{".".join(p)}` 时出错: {str(e)}')
                 continue
@@ -409,9 +628,10 @@ class ConfigGenerator:
             task = path[2]
             try:
                 # 如果存在调度器命令，设置为任务名称并隐藏
-                if deep_get(data, keys=f'{task}.Scheduler.Command'):
-                    deep_set(data, keys=f'{task}.Scheduler.Command.value', value=task)
-                    deep_set(data, keys=f'{task}.Scheduler.Command.display', value='hide')
+                command = deep_get(data, keys=[task, 'Scheduler', 'Command'])
+                if command:
+                    command['value'] = task
+                    command['display'] = 'hide'
             except Exception as e:
                 print(f'错误: 设置命令 `{task}` 时出错: {str(e)}')
                 continue
@@ -430,7 +650,7 @@ class ConfigGenerator:
         """
         visited_group = set()
         visited_path = set()
-        lines = CONFIG_IMPORT
+        lines = CONFIG_IMPORT.copy()
         for path, data in deep_iter(self.argument, depth=2):
             group, arg = path
             if group not in visited_group:
@@ -442,12 +662,22 @@ class ConfigGenerator:
             if 'option' in data and data['option']:
                 option = '  # ' + ', '.join([str(opt) for opt in data['option']])
             path = '.'.join(path)
-            lines.append(f'    {path_to_arg(path)} = {repr(parse_value(data["value"], data=data))}{option}')
+            value = data['value']
+            if 'option' in data and value not in data['option']:
+                # 不在选项中的值保持原样，同parse_value()
+                value = repr(value)
+            else:
+                try:
+                    value = _repr_value(value)
+                except TypeError:
+                    # dict、list等不可哈希的值不缓存
+                    value = repr(parse_value(value, data=data))
+            lines.append(f'    {path_to_arg(path)} = {value}{option}')
             visited_path.add(path)
 
+        lines.append('')
         with open(filepath_code(), 'w', encoding='utf-8', newline='') as f:
-            for text in lines:
-                f.write(text + '\n')
+            f.write('\n'.join(lines))
 
     @timer
     def generate_stored(self):
@@ -461,7 +691,7 @@ class ConfigGenerator:
         gen = get_generator()
         gen.add('from module.config_src.stored.classes import (')
         with gen.tab():
-            for cls in sorted([name for name in dir(classes) if name.startswith('Stored')]):
+            for cls in sorted(name for name in vars(classes) if name.startswith('Stored')):
                 gen.add(cls + ',')
         gen.add(')')
         gen.Empty()
@@ -485,7 +715,20 @@ class ConfigGenerator:
         Returns:
             dict: 遗器昵称与副本ID的映射关系
         """
-        return read_file('tasks/relics/keywords/relicset_nickname.json')
+        return FileCache.read('tasks/relics/keywords/relicset_nickname.json', read_file)
+
+    @cached_property
+    def relics_by_dungeon(self):
+        """
+        按副本ID索引的遗器昵称表。
+
+        Returns:
+            dict: 键：dungeon_id。值：该副本的遗器昵称行列表
+        """
+        data = {}
+        for row in self.relics_nickname.values():
+            data.setdefault(row.get('dungeon_id'), []).append(row)
+        return data
 
     @timer
     def generate_i18n(self, lang):
@@ -503,11 +746,19 @@ class ConfigGenerator:
         old = read_file(filepath_i18n(lang))
 
         def deep_load(keys, default=True, words=('name', 'help')):
+            # old和new中的节点只查找一次，再逐个读写words
+            old_node = deep_get(old, keys=keys)
+            new_node = new
+            for key in keys:
+                new_node = new_node.setdefault(key, {})
+            prefix = '.'.join(keys)
             for word in words:
-                k = keys + [str(word)]
-                d = ".".join(k) if default else str(word)
-                v = deep_get(old, keys=k, default=d)
-                deep_set(new, keys=k, value=v)
+                word = str(word)
+                try:
+                    v = old_node[word]
+                except (KeyError, IndexError, TypeError):
+                    v = f'{prefix}.{word}' if default else word
+                new_node[word] = v
 
         # Menu
         for path, data in deep_iter(self.task, depth=3):
@@ -548,7 +799,8 @@ class ConfigGenerator:
         #         deep_set(new, keys=path, value=f'[{prefix}] {_list[index]}')
 
         ingame_lang = gui_lang_to_ingame_lang(lang)
-        dailies = deep_get(self.argument, keys='Dungeon.Name.option')
+        get_lang = operator.attrgetter(ingame_lang)
+        dailies = set(deep_get(self.argument, keys='Dungeon.Name.option'))
         # Dungeon names
         i18n_memories = {
             'cn': '材料：角色经验（{dungeon} {world}）',
@@ -595,68 +847,69 @@ class ConfigGenerator:
 
         from tasks.dungeon.keywords import DungeonList, DungeonDetailed
         def relicdungeon2name(dun: DungeonList):
-            dungeon_id = dun.dungeon_id
-            relic_list = []
-            for name, row in self.relics_nickname.items():
-                if row.get('dungeon_id') == dungeon_id:
-                    relic_list.append(row.get(ingame_lang, ''))
-            return ' & '.join(relic_list)
-
-        for dungeon in DungeonList.instances.values():
-            dungeon: DungeonList = dungeon
-            dungeon_name = dungeon.__getattribute__(ingame_lang)
-            dungeon_name = re.sub('[「」]', '', dungeon_name)
-            if dungeon.world:
-                world_name = re.sub('[「」]', '', dungeon.world.__getattribute__(ingame_lang))
-            else:
-                world_name = ''
-            if dungeon.is_Calyx_Golden_Memories:
-                deep_set(new, keys=['Dungeon', 'Name', dungeon.name],
-                         value=i18n_memories[ingame_lang].format(dungeon=dungeon_name, world=world_name))
-            if dungeon.is_Calyx_Golden_Aether:
-                deep_set(new, keys=['Dungeon', 'Name', dungeon.name],
-                         value=i18n_aether[ingame_lang].format(dungeon=dungeon_name, world=world_name))
-            if dungeon.is_Calyx_Golden_Treasures:
-                deep_set(new, keys=['Dungeon', 'Name', dungeon.name],
-                         value=i18n_treasure[ingame_lang].format(dungeon=dungeon_name, world=world_name))
-            if dungeon.is_Calyx_Crimson:
-                plane = dungeon.plane.__getattribute__(ingame_lang)
-                plane = re.sub('[「」"]', '', plane)
-                path = dungeon.Calyx_Crimson_Path.__getattribute__(ingame_lang)
-                deep_set(new, keys=['Dungeon', 'Name', dungeon.name],
-                         value=i18n_crimson[ingame_lang].format(path=path, plane=plane))
-            if dungeon.is_Cavern_of_Corrosion:
-                value = relicdungeon2name(dungeon)
-                value = i18n_relic[ingame_lang].format(dungeon=dungeon_name, relic=value)
-                value = value.replace('Cavern of Corrosion: ', '')
-                deep_set(new, keys=['Dungeon', 'Name', dungeon.name], value=value)
-            if dungeon.is_Ornament_Extraction:
-                value = relicdungeon2name(dungeon)
-                value = i18n_ornament[ingame_lang].format(dungeon=dungeon_name, relic=value)
-                value = re.sub(
-                    r'(•差分宇宙'
-                    r'|Divergent Universe: '
-                    r'|階差宇宙・'
-                    r'|: Universo Diferenciado'
-                    r'|Universo Diferenciado: '
-                    r')', '', value)
-                deep_set(new, keys=['Ornament', 'Dungeon', dungeon.name], value=value)
+            rows = self.relics_by_dungeon.get(dun.dungeon_id, [])
+            return ' & '.join([row.get(ingame_lang, '') for row in rows])
+
+        dungeon_classes = _classify_dungeons()
+        dungeon_i18n = new.setdefault('Dungeon', {}).setdefault('Name', {})
+        ornament_i18n = new.setdefault('Ornament', {}).setdefault('Dungeon', {})
+
+        def golden(template):
+            def handler(dungeon):
+                dungeon_name = get_lang(dungeon).translate(_STRIP_BRACKETS)
+                if dungeon.world:
+                    world_name = get_lang(dungeon.world).translate(_STRIP_BRACKETS)
+                else:
+                    world_name = ''
+                dungeon_i18n[dungeon.name] = template.format(dungeon=dungeon_name, world=world_name)
+
+            return handler
+
+        def crimson(dungeon):
+            plane = get_lang(dungeon.plane).translate(_STRIP_BRACKETS_QUOTE)
+            path = get_lang(dungeon.Calyx_Crimson_Path)
+            dungeon_i18n[dungeon.name] = i18n_crimson[ingame_lang].format(path=path, plane=plane)
+
+        def corrosion(dungeon):
+            dungeon_name = get_lang(dungeon).translate(_STRIP_BRACKETS)
+            value = i18n_relic[ingame_lang].format(dungeon=dungeon_name, relic=relicdungeon2name(dungeon))
+            dungeon_i18n[dungeon.name] = value.replace('Cavern of Corrosion: ', '')
+
+        def ornament(dungeon):
+            dungeon_name = get_lang(dungeon).translate(_STRIP_BRACKETS)
+            value = i18n_ornament[ingame_lang].format(dungeon=dungeon_name, relic=relicdungeon2name(dungeon))
+            ornament_i18n[dungeon.name] = _ORNAMENT_STRIP.sub('', value)
+
+        # 下标为_DUNGEON_*类型
+        handlers = [
+            golden(i18n_memories[ingame_lang]),
+            golden(i18n_aether[ingame_lang]),
+            golden(i18n_treasure[ingame_lang]),
+            crimson,
+            corrosion,
+            ornament,
+        ]
+        for dungeon, kind in dungeon_classes.i18n_kinds:
+            handlers[kind](dungeon)
 
         # Stagnant shadows with character names
         for dungeon in DungeonDetailed.instances.values():
             if dungeon.name in dailies:
-                value = dungeon.__getattribute__(ingame_lang)
+                value = get_lang(dungeon)
                 deep_set(new, keys=['Dungeon', 'Name', dungeon.name], value=value)
 
         # Copy dungeon i18n to double events
-        def update_dungeon_names(keys):
-            for dungeon in deep_get(self.argument, keys=f'{keys}.option', default=[]):
-                value = deep_get(new, keys=['Dungeon', 'Name', dungeon])
+        dungeon_names = deep_get(new, keys=['Dungeon', 'Name'], default={})
+
+        def update_dungeon_names(group):
+            target = new.setdefault('Dungeon', {}).setdefault(group, {})
+            for dungeon in deep_get(self.argument, keys=['Dungeon', group, 'option'], default=[]):
+                value = dungeon_names.get(dungeon)
                 if value:
-                    deep_set(new, keys=f'{keys}.{dungeon}', value=value)
+                    target[dungeon] = value
 
-        update_dungeon_names('Dungeon.NameAtDoubleCalyx')
-        update_dungeon_names('Dungeon.NameAtDoubleRelic')
+        update_dungeon_names('NameAtDoubleCalyx')
+        update_dungeon_names('NameAtDoubleRelic')
 
         # Character names
         i18n_trailblazer = {
@@ -668,71 +921,59 @@ class ConfigGenerator:
         }
         from tasks.character.keywords import CharacterList
         from tasks.character.aired_version import get_character_version
-        characters = deep_get(self.argument, keys='DungeonSupport.Character.option')
+        characters = set(deep_get(self.argument, keys='DungeonSupport.Character.option'))
         for character in CharacterList.instances.values():
             if character.name in characters:
-                value = character.__getattribute__(ingame_lang)
+                value = get_lang(character)
                 version = get_character_version(character)
                 if version:
                     value = f'[{version}] {value}'
                 if 'trailblazer' in value.lower():
-                    value = re.sub('Trailblazer', i18n_trailblazer[ingame_lang], value)
+                    value = value.replace('Trailblazer', i18n_trailblazer[ingame_lang])
                 deep_set(new, keys=['DungeonSupport', 'Character', character.name], value=value)
 
         # Assignments
         from tasks.assignment.keywords import AssignmentEntryDetailed
-        for entry in AssignmentEntryDetailed.instances.values():
-            entry: AssignmentEntryDetailed
-            value = entry.__getattribute__(ingame_lang)
-            for i in range(4):
-                deep_set(new, keys=['Assignment', f'Name_{i + 1}', entry.name], value=value)
+        assignments = {entry.name: get_lang(entry) for entry in AssignmentEntryDetailed.instances.values()}
+        assignment_root = new.setdefault('Assignment', {})
+        for i in range(4):
+            # Name_1到Name_4中已有name、help等翻译，只更新委托名
+            assignment_root.setdefault(f'Name_{i + 1}', {}).update(assignments)
 
         # Echo of War
-        dungeons = [d for d in DungeonList.instances.values() if d.is_Echo_of_War]
-        for dungeon in dungeons:
+        for dungeon in dungeon_classes.echo_of_war:
             world = dungeon.plane.world
-            world_name = world.__getattribute__(ingame_lang)
-            dungeon_name = dungeon.__getattribute__(ingame_lang).replace('Echo of War: ', '')
+            world_name = get_lang(world)
+            dungeon_name = get_lang(dungeon).replace('Echo of War: ', '')
             value = f'{dungeon_name} ({world_name})'
             deep_set(new, keys=['Weekly', 'Name', dungeon.name], value=value)
         # Rogue worlds
-        for dungeon in [d for d in DungeonList.instances.values() if d.is_Simulated_Universe]:
+        for dungeon in dungeon_classes.simulated_universe:
             name = deep_get(new, keys=['RogueWorld', 'World', dungeon.name], default=None)
             if name:
-                deep_set(new, keys=['RogueWorld', 'World', dungeon.name], value=dungeon.__getattribute__(ingame_lang))
+                deep_set(new, keys=['RogueWorld', 'World', dungeon.name], value=get_lang(dungeon))
         # Planner items
-        from tasks.planner.keywords.classes import ItemBase
-        for item in ItemBase.instances.values():
-            item: ItemBase = item
-            name = f'Item_{item.name}'
-            if item.is_ItemValuable:
-                continue
-            if item.is_ItemCurrency or item.name == 'Tracks_of_Destiny':
-                i18n = item.__getattribute__(ingame_lang)
-            elif item.is_ItemExp and item.is_group_base:
-                dungeon = item.dungeon
-                if dungeon is None:
-                    i18n = item.__getattribute__(ingame_lang)
-                elif dungeon.is_Calyx_Golden_Memories:
+        weekly_i18n = deep_get(new, keys=['Weekly', 'Name'], default={})
+        planner_i18n = new.setdefault('Planner', {})
+        for name, kind, source in _classify_items():
+            if kind == _ITEM_LANG:
+                i18n = get_lang(source)
+            elif kind == _ITEM_DUNGEON:
+                i18n = dungeon_i18n.get(source, 'Unknown_Dungeon_Come_From')
+            elif kind == _ITEM_WEEKLY:
+                i18n = weekly_i18n.get(source, 'Unknown_Dungeon_Come_From')
+            else:
+                if kind == _ITEM_EXP_LANG:
+                    i18n = get_lang(source)
+                elif kind == _ITEM_EXP_MEMORIES:
                     i18n = i18n_memories[ingame_lang]
-                elif dungeon.is_Calyx_Golden_Aether:
-                    i18n = i18n_aether[ingame_lang]
                 else:
-                    continue
-                if res := re.search(r'[:：](.*)[(（]', i18n):
+                    i18n = i18n_aether[ingame_lang]
+                if res := _ITEM_TITLE_RE.search(i18n):
                     i18n = res.group(1).strip()
-            elif item.is_ItemAscension or (item.is_ItemTrace and item.is_group_base):
-                dungeon = item.group_base.dungeon.name
-                i18n = deep_get(new, keys=['Dungeon', 'Name', dungeon], default='Unknown_Dungeon_Come_From')
-            elif item.is_ItemWeekly:
-                dungeon = item.dungeon.name
-                i18n = deep_get(new, keys=['Weekly', 'Name', dungeon], default='Unknown_Dungeon_Come_From')
-            elif item.is_ItemCalyx and item.is_group_base:
-                i18n = item.__getattribute__(ingame_lang)
-            else:
-                continue
-            deep_set(new, keys=['Planner', name, 'name'], value=i18n)
-            deep_set(new, keys=['Planner', name, 'help'], value='')
+            row = planner_i18n.setdefault(name, {})
+            row['name'] = i18n
+            row['help'] = ''
 
         # GUI i18n
         for path, _ in deep_iter(self.gui, depth=2):
@@ -740,20 +981,9 @@ class ConfigGenerator:
             deep_load(keys=['Gui', group], words=(key,))
 
         # zh-TW
-        dic_repl = {
-            '設置': '設定',
-            '支持': '支援',
-            '啓': '啟',
-            '异': '異',
-            '服務器': '伺服器',
-            '文件': '檔案',
-            '自定義': '自訂'
-        }
         if lang == 'zh-TW':
             for path, value in deep_iter(new, depth=3):
-                for before, after in dic_repl.items():
-                    value = value.replace(before, after)
-                deep_set(new, keys=path, value=value)
+                deep_set(new, keys=path, value=_zhtw_convert(value))
 
         write_file(filepath_i18n(lang), new)
 
@@ -848,7 +1078,8 @@ class ConfigGenerator:
 
         def update(suffix, *args):
             file = f'./config_src/deploy.{suffix}.yaml'
-            new = deepcopy(template)
+            # poor_yaml_read得到的是一层的字典，值都是标量，浅复制即可
+            new = dict(template)
             for dic in args:
                 new.update(dic)
             poor_yaml_write(data=new, file=file)
@@ -870,7 +1101,7 @@ class ConfigGenerator:
         }
 
         def update(file, *args):
-            new = deepcopy(template)
+            new = dict(template)
             for dic in args:
                 new.update(dic)
             poor_yaml_write(data=new, file=file)
@@ -884,16 +1115,16 @@ class ConfigGenerator:
         会遍历所有支持的角色名称，检查 assets/character 目录下是否有对应的图片文件，若缺失则输出警告。
         """
         characters = deep_get(self.args, 'Dungeon.DungeonSupport.Character.option', default=[])
-        for name in characters:
-            if name == 'FirstCharacter':
-                continue
-            if name.startswith('Trailblazer'):
-                for name in [f'Stelle{name[11:]}', f'Caelum{name[11:]}']:
-                    if not os.path.exists(f'./assets/character/{name}.png'):
-                        print(f'WARNING: character template not exist: {name}')
-            else:
-                if not os.path.exists(f'./assets/character/{name}.png'):
-                    print(f'WARNING: character template not exist: {name}')
+        # 扫描一次目录，代替逐个角色os.path.exists
+        try:
+            with os.scandir('./assets/character') as entries:
+                existing = {entry.name[:-4] for entry in entries if entry.name.endswith('.png')}
+        except FileNotFoundError:
+            existing = set()
+        missing = [name for character in characters for name in _character_templates(character)
+                   if name not in existing]
+        for name in missing:
+            print(f'WARNING: character template not exist: {name}')
 
     @timer
     def generate(self):
@@ -915,9 +1146,141 @@ class ConfigGenerator:
         for lang in LANGUAGES:
             self.generate_i18n(lang)
         self.generate_deploy_template()
+        ConfigUpdater.clear_args_cache()
         self.check_character_templates()
 
 
+# ConfigUpdater.update_state()中用到的键路径，预先拆分
+_K_USE_IMMERSIFIER = ('Rogue', 'RogueWorld', 'UseImmersifier')
+_K_USE_STAMINA = ('Rogue', 'RogueWorld', 'UseStamina')
+_K_DOUBLE_EVENT = ('Rogue', 'RogueWorld', 'DoubleEvent')
+_K_DUNGEON_ENABLE = ('Dungeon', 'Scheduler', 'Enable')
+_K_GAME_CLIENT = ('Alas', 'Emulator', 'GameClient')
+_K_PACKAGE_NAME = ('Alas', 'Emulator', 'PackageName')
+
+_SAVE_DUNGEON_NAME = 1
+_SAVE_DUNGEON_RELIC = 2
+
+
+@lru_cache(maxsize=None)
+def _save_dungeon_kind(key):
+    """
+    配置键的种类有限，每个键只做一次前缀判断。
+
+    Args:
+        key (str): 配置json中的键路径
+
+    Returns:
+        int: Dungeon.Dungeon*.*Name返回_SAVE_DUNGEON_NAME，
+            Dungeon.Dungeon*.*CavernOfCorrosion返回_SAVE_DUNGEON_RELIC，其他返回0
+    """
+    # Dungeon.DungeonDaily也以Dungeon.Dungeon开头
+    if not key.startswith('Dungeon.Dungeon'):
+        return 0
+    if key.endswith('Name'):
+        return _SAVE_DUNGEON_NAME
+    if key.endswith('CavernOfCorrosion'):
+        return _SAVE_DUNGEON_RELIC
+    return 0
+
+
+@lru_cache(maxsize=256)
+def _find_dungeon(name):
+    """
+    Args:
+        name (str): 用户设置的副本名
+
+    Returns:
+        DungeonList: 找不到时返回None
+    """
+    from tasks.dungeon.keywords.dungeon import DungeonList
+    from module.exception import ScriptError
+    try:
+        return DungeonList.find(name)
+    except ScriptError:
+        return None
+
+
+def _save_use_immersifier(value):
+    if value is False:
+        yield 'Rogue.RogueWorld.UseStamina', False
+
+
+def _save_use_stamina(value):
+    if value is True:
+        yield 'Rogue.RogueWorld.UseImmersifier', True
+
+
+def _save_double_event(value):
+    if value is True:
+        yield 'Rogue.RogueWorld.UseImmersifier', True
+
+
+def _save_game_client(value):
+    if value == 'cloud_android':
+        yield 'Alas.Emulator.PackageName', 'CN-Official'
+        yield 'Alas.Optimization.WhenTaskQueueEmpty', 'close_game'
+
+
+def _save_sync(target):
+    def callback(value):
+        yield target, value
+
+    return callback
+
+
+# 键：配置键。值：生成需要同时设置的(键, 值)的函数。用于ConfigUpdater.save_callback()
+_SAVE_CALLBACKS = {
+    'Rogue.RogueWorld.UseImmersifier': _save_use_immersifier,
+    'Rogue.RogueWorld.UseStamina': _save_use_stamina,
+    'Rogue.RogueWorld.DoubleEvent': _save_double_event,
+    'Alas.Emulator.GameClient': _save_game_client,
+    # 同步Dungeon.TrailblazePower和Ornament.TrailblazePower
+    'Dungeon.TrailblazePower.ExtractReservedTrailblazePower':
+        _save_sync('Ornament.TrailblazePower.ExtractReservedTrailblazePower'),
+    'Dungeon.TrailblazePower.UseFuel': _save_sync('Ornament.TrailblazePower.UseFuel'),
+    'Dungeon.TrailblazePower.FuelReserve': _save_sync('Ornament.TrailblazePower.FuelReserve'),
+    'Ornament.TrailblazePower.ExtractReservedTrailblazePower':
+        _save_sync('Dungeon.TrailblazePower.ExtractReservedTrailblazePower'),
+    'Ornament.TrailblazePower.UseFuel': _save_sync('Dungeon.TrailblazePower.UseFuel'),
+    'Ornament.TrailblazePower.FuelReserve': _save_sync('Dungeon.TrailblazePower.FuelReserve'),
+}
+
+
+# 可能被隐藏的参数，顺序与_hidden_args_key()一致
+_HIDDEN_ARGS = (
+    'Dungeon.TrailblazePower.FuelReserve',
+    'Ornament.TrailblazePower.FuelReserve',
+    'Rogue.RogueBlessing.CustomBlessingFilter',
+    'Rogue.RogueBlessing.CustomResonanceFilter',
+    'Rogue.RogueBlessing.CustomCurioFilter',
+    'Rogue.RogueWorld.SimulatedUniverseFarm',
+)
+
+
+def _hidden_args_key(data):
+    """
+    Args:
+        data (dict): 配置数据
+
+    Returns:
+        tuple[bool]: _HIDDEN_ARGS中每个参数是否隐藏
+    """
+    return (
+        deep_get3(data, 'Dungeon', 'TrailblazePower', 'UseFuel') == False,
+        deep_get3(data, 'Ornament', 'TrailblazePower', 'UseFuel') == False,
+        deep_get3(data, 'Rogue', 'RogueBlessing', 'PresetBlessingFilter') != 'custom',
+        deep_get3(data, 'Rogue', 'RogueBlessing', 'PresetResonanceFilter') != 'custom',
+        deep_get3(data, 'Rogue', 'RogueBlessing', 'PresetCurioFilter') != 'custom',
+        deep_get3(data, 'Rogue', 'RogueWorld', 'WeeklyFarming', default=False) is False,
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_hidden_args(key):
+    return frozenset(arg for arg, hidden in zip(_HIDDEN_ARGS, key) if hidden)
+
+
 class ConfigUpdater:
     """
     配置更新器类，用于更新和管理现有配置。
@@ -969,11 +1332,61 @@ class ConfigUpdater:
         # 3.2
         ('Weekly.Weekly.Name', 'Weekly.Weekly.Name', convert_32_weekly),
     ]
+    # 键：config_name。值：((文件大小, 修改时间), 文件内容的摘要, config_update()的结果)，仅在本进程内有效
+    _updated = {}
 
-    @cached_property
-    def args(self):
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_args():
+        # args.json 在进程内不变，所有实例共享同一份解析结果，只读不写
         return read_file(filepath_args())
 
+    @property
+    def args(self):
+        return self._load_args()
+
+    @classmethod
+    def clear_args_cache(cls):
+        """
+        清除共享的 args 缓存，args.json 重新生成后调用。
+        """
+        cls._load_args.cache_clear()
+        ConfigUpdater._updated.clear()
+
+    @cached_property
+    def redirection_compiled(self):
+        """
+        预先拆分的`redirection`，用于config_redirect()。
+
+        Returns:
+            list[tuple]: (source, target, update_func, multi_source, multi_target, same)，
+                source和target为拆分后的键元组，multi_*时为键元组的元组
+        """
+        def split(keys):
+            return tuple(keys.split('.'))
+
+        out = []
+        for row in self.redirection:
+            if len(row) == 2:
+                source, target = row
+                update_func = None
+            elif len(row) == 3:
+                source, target, update_func = row
+            else:
+                continue
+            multi_source = isinstance(source, tuple)
+            multi_target = isinstance(target, tuple)
+            out.append((
+                tuple(split(k) for k in source) if multi_source else split(source),
+                tuple(split(k) for k in target) if multi_target else split(target),
+                update_func,
+                multi_source,
+                multi_target,
+                # Allow update same key
+                source == target,
+            ))
+        return out
+
     def config_update(self, old, is_template=False):
         """
         Args:
@@ -985,15 +1398,19 @@ class ConfigUpdater:
         """
         new = {}
 
-        for keys, data in deep_iter(self.args, depth=3):
-            value = deep_get(old, keys=keys, default=data['value'])
+        for (task, group, arg), data in deep_iter(self.args, depth=3):
+            value = deep_get3(old, task, group, arg, default=data['value'])
             typ = data['type']
             display = data.get('display')
             if is_template or value is None or value == '' \
                     or typ in ['lock', 'state'] or (display == 'hide' and typ != 'stored'):
                 value = data['value']
             value = parse_value(value, data=data)
-            deep_set(new, keys=keys, value=value)
+            if value is data['value']:
+                # args 在实例间共享，默认值需要复制一份再写入配置
+                # 值不在选项中时parse_value也会返回默认值，所以在解析之后检查
+                value = _fast_clone(value)
+            deep_set3(new, task, group, arg, value)
 
         if not is_template:
             new = self.config_redirect(old, new)
@@ -1012,25 +1429,10 @@ class ConfigUpdater:
         Returns:
             dict:
         """
-        for row in self.redirection:
-            if len(row) == 2:
-                source, target = row
-                update_func = None
-            elif len(row) == 3:
-                source, target, update_func = row
-            else:
-                continue
-
-            if isinstance(source, tuple):
-                value = []
-                error = False
-                for attribute in source:
-                    tmp = deep_get(old, keys=attribute)
-                    if tmp is None:
-                        error = True
-                        continue
-                    value.append(tmp)
-                if error:
+        for source, target, update_func, multi_source, multi_target, same in self.redirection_compiled:
+            if multi_source:
+                value = [deep_get(old, keys=k) for k in source]
+                if any(v is None for v in value):
                     continue
             else:
                 value = deep_get(old, keys=source)
@@ -1040,12 +1442,12 @@ class ConfigUpdater:
             if update_func is not None:
                 value = update_func(value)
 
-            if isinstance(target, tuple):
+            if multi_target:
                 for k, v in zip(target, value):
                     # Allow update same key
-                    if (deep_get(old, keys=k) is None) or (source == target):
+                    if same or deep_get(old, keys=k) is None:
                         deep_set(new, keys=k, value=v)
-            elif (deep_get(old, keys=target) is None) or (source == target):
+            elif same or deep_get(old, keys=target) is None:
                 deep_set(new, keys=target, value=value)
 
         return new
@@ -1053,18 +1455,18 @@ class ConfigUpdater:
     @staticmethod
     def update_state(data):
         # Limit setting combinations
-        if deep_get(data, keys='Rogue.RogueWorld.UseImmersifier') is False:
-            deep_set(data, keys='Rogue.RogueWorld.UseStamina', value=False)
-        if deep_get(data, keys='Rogue.RogueWorld.UseStamina') is True:
-            deep_set(data, keys='Rogue.RogueWorld.UseImmersifier', value=True)
-        if deep_get(data, keys='Rogue.RogueWorld.DoubleEvent') is True:
-            deep_set(data, keys='Rogue.RogueWorld.UseImmersifier', value=True)
+        if deep_get3(data, *_K_USE_IMMERSIFIER) is False:
+            deep_set3(data, *_K_USE_STAMINA, False)
+        if deep_get3(data, *_K_USE_STAMINA) is True:
+            deep_set3(data, *_K_USE_IMMERSIFIER, True)
+        if deep_get3(data, *_K_DOUBLE_EVENT) is True:
+            deep_set3(data, *_K_USE_IMMERSIFIER, True)
         # Store immersifier in dungeon task
-        if deep_get(data, keys='Rogue.RogueWorld.UseImmersifier') is True:
-            deep_set(data, keys='Dungeon.Scheduler.Enable', value=True)
+        if deep_get3(data, *_K_USE_IMMERSIFIER) is True:
+            deep_set3(data, *_K_DUNGEON_ENABLE, True)
         # Cloud settings
-        if deep_get(data, keys='Alas.Emulator.GameClient') == 'cloud_android':
-            deep_set(data, keys='Alas.Emulator.PackageName', value='CN-Official')
+        if deep_get3(data, *_K_GAME_CLIENT) == 'cloud_android':
+            deep_set3(data, *_K_PACKAGE_NAME, 'CN-Official')
 
         return data
 
@@ -1078,44 +1480,23 @@ class ConfigUpdater:
             str: Key path to set config_src json, such as "Main.Emotion.Fleet1Record"
             any: Value to set, such as "2020-01-01 00:00:00"
         """
-        if key.startswith('Dungeon.Dungeon') or key.startswith('Dungeon.DungeonDaily'):
-            from tasks.dungeon.keywords.dungeon import DungeonList
-            from module.exception import ScriptError
-            try:
-                dungeon = DungeonList.find(value)
-            except ScriptError:
+        kind = _save_dungeon_kind(key)
+        if kind:
+            dungeon = _find_dungeon(value)
+            if dungeon is None:
                 return
-            if key.endswith('Name'):
+            if kind == _SAVE_DUNGEON_NAME:
                 if dungeon.is_Calyx_Golden:
                     yield 'Dungeon.Dungeon.NameAtDoubleCalyx', value
                 elif dungeon.is_Calyx_Crimson:
                     yield 'Dungeon.Dungeon.NameAtDoubleCalyx', value
                 elif dungeon.is_Cavern_of_Corrosion:
                     yield 'Dungeon.Dungeon.NameAtDoubleRelic', value
-            elif key.endswith('CavernOfCorrosion'):
+            else:
                 yield 'Dungeon.Dungeon.NameAtDoubleRelic', value
-        if key == 'Rogue.RogueWorld.UseImmersifier' and value is False:
-            yield 'Rogue.RogueWorld.UseStamina', False
-        if key == 'Rogue.RogueWorld.UseStamina' and value is True:
-            yield 'Rogue.RogueWorld.UseImmersifier', True
-        if key == 'Rogue.RogueWorld.DoubleEvent' and value is True:
-            yield 'Rogue.RogueWorld.UseImmersifier', True
-        if key == 'Alas.Emulator.GameClient' and value == 'cloud_android':
-            yield 'Alas.Emulator.PackageName', 'CN-Official'
-            yield 'Alas.Optimization.WhenTaskQueueEmpty', 'close_game'
-        # Sync Dungeon.TrailblazePower and Ornament.TrailblazePower
-        if key == 'Dungeon.TrailblazePower.ExtractReservedTrailblazePower':
-            yield 'Ornament.TrailblazePower.ExtractReservedTrailblazePower', value
-        if key == 'Dungeon.TrailblazePower.UseFuel':
-            yield 'Ornament.TrailblazePower.UseFuel', value
-        if key == 'Dungeon.TrailblazePower.FuelReserve':
-            yield 'Ornament.TrailblazePower.FuelReserve', value
-        if key == 'Ornament.TrailblazePower.ExtractReservedTrailblazePower':
-            yield 'Dungeon.TrailblazePower.ExtractReservedTrailblazePower', value
-        if key == 'Ornament.TrailblazePower.UseFuel':
-            yield 'Dungeon.TrailblazePower.UseFuel', value
-        if key == 'Ornament.TrailblazePower.FuelReserve':
-            yield 'Dungeon.TrailblazePower.FuelReserve', value
+        callback = _SAVE_CALLBACKS.get(key)
+        if callback is not None:
+            yield from callback(value)
 
     def iter_hidden_args(self, data) -> t.Iterator[str]:
         """
@@ -1125,25 +1506,15 @@ class ConfigUpdater:
         Yields:
             str: Arg path that should be hidden
         """
-        if deep_get(data, 'Dungeon.TrailblazePower.UseFuel') == False:
-            yield 'Dungeon.TrailblazePower.FuelReserve'
-        if deep_get(data, 'Ornament.TrailblazePower.UseFuel') == False:
-            yield 'Ornament.TrailblazePower.FuelReserve'
-        if deep_get(data, 'Rogue.RogueBlessing.PresetBlessingFilter') != 'custom':
-            yield 'Rogue.RogueBlessing.CustomBlessingFilter'
-        if deep_get(data, 'Rogue.RogueBlessing.PresetResonanceFilter') != 'custom':
-            yield 'Rogue.RogueBlessing.CustomResonanceFilter'
-        if deep_get(data, 'Rogue.RogueBlessing.PresetCurioFilter') != 'custom':
-            yield 'Rogue.RogueBlessing.CustomCurioFilter'
-        if deep_get(data, 'Rogue.RogueWorld.WeeklyFarming', default=False) is False:
-            yield 'Rogue.RogueWorld.SimulatedUniverseFarm'
+        for arg, hidden in zip(_HIDDEN_ARGS, _hidden_args_key(data)):
+            if hidden:
+                yield arg
 
     def get_hidden_args(self, data) -> t.Set[str]:
         """
         Return a set of hidden args
         """
-        out = list(self.iter_hidden_args(data))
-        return set(out)
+        return set(_get_hidden_args(_hidden_args_key(data)))
 
     def read_file(self, config_name, is_template=False):
         """
@@ -1156,13 +1527,44 @@ class ConfigUpdater:
         Returns:
             dict:
         """
-        old = read_file(filepath_config(config_name))
-        new = self.config_update(old, is_template=is_template)
+        file = filepath_config(config_name)
+        if is_template:
+            return self.config_update(read_file(file), is_template=True)
+
+        # config_update()的结果只取决于文件内容和args，文件的大小和修改时间不变时复用上次的结果
+        # 先获取文件状态再读取，读取期间文件被改写时下次也会重新读取
+        try:
+            stat = os.stat(file)
+            stamp = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            stamp = None
+        cached = ConfigUpdater._updated.get(config_name)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return _fast_clone(cached[2])
+        old, digest = read_file_digest(file)
+        new = self.config_update(old)
+        ConfigUpdater._updated[config_name] = (stamp, digest, _fast_clone(new))
         # The updated config_src did not write into file, although it doesn't matters.
         # Commented for performance issue
         # self.write_file(config_name, new)
         return new
 
+    @staticmethod
+    def file_digest(config_name):
+        """
+        获取上次read_file()读取到的文件内容摘要。
+
+        Args:
+            config_name (str): ./config_src/{file}.json
+
+        Returns:
+            bytes: 文件内容的摘要，未读取过时返回None
+        """
+        cached = ConfigUpdater._updated.get(config_name)
+        if cached is None:
+            return None
+        return cached[1]
+
     @staticmethod
     def write_file(config_name, data, mod_name='alas'):
         """
@@ -3,6 +3,51 @@
 主要处理副本名称、活动名称等在不同版本或场景下的映射关系。
 """
 
+# 旧名称 -> 新名称
+_MAP_DAILY = {
+    'Calyx_Crimson_Hunt': 'Calyx_Crimson_The_Hunt',
+}
+_MAP_20_DUNGEON = {
+    # 金色回忆副本转换
+    'Calyx_Golden_Memories': 'Calyx_Golden_Memories_Jarilo_VI',
+    'Calyx_Golden_Aether': 'Calyx_Golden_Aether_Jarilo_VI',
+    'Calyx_Golden_Treasures': 'Calyx_Golden_Treasures_Jarilo_VI',
+    # 红色副本转换
+    'Calyx_Crimson_Destruction': 'Calyx_Crimson_Destruction_Herta_StorageZone',
+    'Calyx_Crimson_The_Hunt': 'Calyx_Crimson_The_Hunt_Jarilo_OutlyingSnowPlains',
+    'Calyx_Crimson_Erudition': 'Calyx_Crimson_Erudition_Jarilo_RivetTown',
+    'Calyx_Crimson_Harmony': 'Calyx_Crimson_Harmony_Jarilo_RobotSettlement',
+    'Calyx_Crimson_Nihility': 'Calyx_Crimson_Nihility_Jarilo_GreatMine',
+    'Calyx_Crimson_Preservation': 'Calyx_Crimson_Preservation_Herta_SupplyZone',
+    'Calyx_Crimson_Abundance': 'Calyx_Crimson_Abundance_Jarilo_BackwaterPass',
+}
+_MAP_31_DUNGEON = {
+    'Calyx_Crimson_Remembrance_Special_StrifeRuinsCastrumKremnos':
+        'Calyx_Crimson_Remembrance_Amphoreus_StrifeRuinsCastrumKremnos',
+}
+_MAP_32_WEEKLY = {
+    'Echo_of_War_Borehole_Planet_Old_Crater': 'Echo_of_War_Borehole_Planet_Past_Nightmares',
+}
+
+
+def _convert_name(mapping, value):
+    """
+    按映射表转换名称，不在表中的值原样返回。
+
+    Args:
+        mapping (dict): 旧名称到新名称的映射
+        value: 原始值
+
+    Returns:
+        转换后的值
+    """
+    try:
+        return mapping.get(value, value)
+    except TypeError:
+        # 配置文件中的值不可哈希，如列表、字典
+        return value
+
+
 def convert_daily(value):
     """
     转换每日任务名称。
@@ -14,9 +59,7 @@ def convert_daily(value):
     Returns:
         str: 转换后的任务名称
     """
-    if value == "Calyx_Crimson_Hunt":
-        value = "Calyx_Crimson_The_Hunt"
-    return value
+    return _convert_name(_MAP_DAILY, value)
 
 
 def convert_20_dungeon(value):
@@ -30,33 +73,7 @@ def convert_20_dungeon(value):
     Returns:
         str: 转换后的副本名称
     """
-    # 金色回忆副本转换
-    if value == 'Calyx_Golden_Memories':
-        return 'Calyx_Golden_Memories_Jarilo_VI'
-    if value == 'Calyx_Golden_Aether':
-        return 'Calyx_Golden_Aether_Jarilo_VI'
-    if value == 'Calyx_Golden_Treasures':
-        return 'Calyx_Golden_Treasures_Jarilo_VI'
-    if value == 'Calyx_Golden_Memories':
-        return 'Calyx_Golden_Memories_Jarilo_VI'
-
-    # 红色副本转换
-    if value == 'Calyx_Crimson_Destruction':
-        return 'Calyx_Crimson_Destruction_Herta_StorageZone'
-    if value == 'Calyx_Crimson_The_Hunt':
-        return 'Calyx_Crimson_The_Hunt_Jarilo_OutlyingSnowPlains'
-    if value == 'Calyx_Crimson_Erudition':
-        return 'Calyx_Crimson_Erudition_Jarilo_RivetTown'
-    if value == 'Calyx_Crimson_Harmony':
-        return 'Calyx_Crimson_Harmony_Jarilo_RobotSettlement'
-    if value == 'Calyx_Crimson_Nihility':
-        return 'Calyx_Crimson_Nihility_Jarilo_GreatMine'
-    if value == 'Calyx_Crimson_Preservation':
-        return 'Calyx_Crimson_Preservation_Herta_SupplyZone'
-    if value == 'Calyx_Crimson_Abundance':
-        return 'Calyx_Crimson_Abundance_Jarilo_BackwaterPass'
-
-    return value
+    return _convert_name(_MAP_20_DUNGEON, value)
 
 
 def convert_rogue_farm(value):
@@ -103,9 +120,7 @@ def convert_31_dungeon(value):
     Returns:
         str: 转换后的副本名称
     """
-    if value == 'Calyx_Crimson_Remembrance_Special_StrifeRuinsCastrumKremnos':
-        return 'Calyx_Crimson_Remembrance_Amphoreus_StrifeRuinsCastrumKremnos'
-    return value
+    return _convert_name(_MAP_31_DUNGEON, value)
 
 
 def convert_32_weekly(value):
@@ -119,6 +134,4 @@ def convert_32_weekly(value):
     Returns:
         str: 转换后的副本名称
     """
-    if value == 'Echo_of_War_Borehole_Planet_Old_Crater':
-        return 'Echo_of_War_Borehole_Planet_Past_Nightmares'
-    return value
+    return _convert_name(_MAP_32_WEEKLY, value)
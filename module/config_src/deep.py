@@ -9,6 +9,10 @@
 """
 
 from collections import deque
+from functools import lru_cache
+
+# deep_get中表示键不存在的哨兵
+_MISSING = object()
 
 # 操作类型常量
 OP_ADD = 'add'  # 添加操作
@@ -16,13 +20,27 @@ OP_SET = 'set'  # 设置操作
 OP_DEL = 'del'  # 删除操作
 
 
+@lru_cache(maxsize=4096)
+def _split_key(keys):
+    """
+    拆分并缓存点号分隔的键路径，同一路径只拆分一次
+
+    Args:
+        keys (str): 键路径，如 'Scheduler.NextRun.value'
+
+    Returns:
+        tuple[str]: 如 ('Scheduler', 'NextRun', 'value')
+    """
+    return tuple(keys.split('.'))
+
+
 def deep_get(d, keys, default=None):
     """
     从嵌套字典和列表中安全地获取值
     
     Args:
         d (dict): 要查询的字典
-        keys (list[str], str): 键路径，如 ['Scheduler', 'NextRun', 'value']
+        keys (tuple[str], list[str], str): 键路径，如 ('Scheduler', 'NextRun', 'value')
         default: 当键不存在时返回的默认值
 
     Returns:
@@ -30,7 +48,7 @@ def deep_get(d, keys, default=None):
     """
     # 性能：240 + 30 * 深度 (纳秒)
     if type(keys) is str:
-        keys = keys.split('.')
+        keys = _split_key(keys)
 
     try:
         for k in keys:
@@ -44,13 +62,34 @@ def deep_get(d, keys, default=None):
         return default
 
 
+def deep_get3(d, k1, k2, k3, default=None):
+    """
+    deep_get的深度为3时的特化版本，用于配置文件中 任务.组.参数 的路径
+    行为与 deep_get(d, [k1, k2, k3], default) 相同
+
+    Args:
+        d (dict): 要查询的字典
+        k1 (str): 第一层键
+        k2 (str): 第二层键
+        k3 (str): 第三层键
+        default: 当键不存在时返回的默认值
+
+    Returns:
+        指定键路径上的值，如果不存在则返回默认值
+    """
+    try:
+        return d[k1][k2][k3]
+    except (KeyError, IndexError, TypeError):
+        return default
+
+
 def deep_get_with_error(d, keys):
     """
     从嵌套字典和列表中获取值，如果键不存在则抛出KeyError
     
     Args:
         d (dict): 要查询的字典
-        keys (list[str], str): 键路径，如 ['Scheduler', 'NextRun', 'value']
+        keys (tuple[str], list[str], str): 键路径，如 ('Scheduler', 'NextRun', 'value')
 
     Returns:
         指定键路径上的值
@@ -58,18 +97,11 @@ def deep_get_with_error(d, keys):
     Raises:
         KeyError: 当键不存在时抛出
     """
-    # 性能：240 + 30 * 深度 (纳秒)
-    if type(keys) is str:
-        keys = keys.split('.')
-
-    try:
-        for k in keys:
-            d = d[k]
-        return d
-    except IndexError:  # 键不存在
-        raise KeyError
-    except TypeError:  # 输入keys不可迭代或d不是字典
-        raise KeyError
+    # deep_get是热路径，保持原样；这里复用deep_get，用哨兵区分不存在和值为None
+    value = deep_get(d, keys, default=_MISSING)
+    if value is _MISSING:
+        raise KeyError(keys)
+    return value
 
 
 def deep_exist(d, keys):
@@ -85,7 +117,7 @@ def deep_exist(d, keys):
     """
     # 性能：240 + 30 * 深度 (纳秒)
     if type(keys) is str:
-        keys = keys.split('.')
+        keys = _split_key(keys)
 
     try:
         for k in keys:
@@ -102,55 +134,77 @@ def deep_exist(d, keys):
 def deep_set(d, keys, value):
     """
     安全地在嵌套字典中设置值
+    路径上不存在或不是字典的中间层会被替换为新字典
     
     Args:
         d (dict): 要设置的字典
-        keys (list[str], str): 键路径
+        keys (tuple[str], list[str], str): 键路径
         value: 要设置的值
     """
-    # 性能：150 * 深度 (纳秒)
+    # 性能：130 + 30 * 深度 (纳秒)
     if type(keys) is str:
-        keys = keys.split('.')
+        keys = _split_key(keys)
 
-    first = True
-    exist = True
-    prev_d = None
-    prev_k = None
-    prev_k2 = None
     try:
-        for k in keys:
-            if first:
-                prev_d = d
-                prev_k = k
-                first = False
-                continue
-            try:
-                # 性能比较：if key in dict: dict[key] > dict.get > dict.setdefault > try dict[key] except
-                if exist and prev_k in d:
-                    prev_d = d
-                    d = d[prev_k]
-                else:
-                    exist = False
-                    new = {}
-                    d[prev_k] = new
-                    d = new
-            except TypeError:  # d不是字典
-                exist = False
-                d = {}
-                prev_d[prev_k2] = {prev_k: d}
-
-            prev_k2 = prev_k
-            prev_k = k
+        last = len(keys) - 1
     except TypeError:  # 输入keys不可迭代
         return
+    if last < 0:  # 空路径
+        return
 
-    # 设置最后一个键的值
+    # 第一遍：沿已存在的字典向下走，中间层是列表时按下标进入
+    parent = parent_key = None
+    index = 0
     try:
-        d[prev_k] = value
-        return
-    except TypeError:  # 最后的d不是字典
-        prev_d[prev_k2] = {prev_k: value}
+        nxt = d.get(keys[0]) if last else None
+    except AttributeError:  # 输入d不是字典
         return
+    while index < last:
+        if type(nxt) is not dict and type(nxt) is not list:
+            break
+        parent, parent_key = d, keys[index]
+        d = nxt
+        index += 1
+        if index == last:
+            break
+        if type(d) is dict:
+            nxt = d.get(keys[index])
+        else:
+            try:
+                nxt = d[keys[index]]
+            except (IndexError, TypeError):  # 下标越界或不是整数
+                nxt = None
+
+    # 第二遍：从右向左构建剩余路径，一次性挂到最后存在的节点上
+    key = keys[index]
+    while last > index:
+        value = {keys[last]: value}
+        last -= 1
+    try:
+        d[key] = value
+    except TypeError:  # 列表的下标不是整数，替换为字典
+        if parent is None:
+            raise
+        parent[parent_key] = {key: value}
+
+
+def deep_set3(d, k1, k2, k3, value):
+    """
+    deep_set的深度为3时的特化版本
+    行为与 deep_set(d, [k1, k2, k3], value) 相同
+
+    Args:
+        d (dict): 要设置的字典
+        k1 (str): 第一层键
+        k2 (str): 第二层键
+        k3 (str): 第三层键
+        value: 要设置的值
+    """
+    try:
+        d[k1][k2][k3] = value
+    except (KeyError, IndexError, TypeError):
+        # 中间层不存在或不是字典，交给deep_set创建
+        deep_set(d, (k1, k2, k3), value)
 
 
 def deep_default(d, keys, value):
@@ -159,12 +213,12 @@ def deep_default(d, keys, value):
     
     Args:
         d (dict): 要设置的字典
-        keys (list[str], str): 键路径
+        keys (tuple[str], list[str], str): 键路径
         value: 要设置的默认值
     """
     # 性能：150 * 深度 (纳秒)
     if type(keys) is str:
-        keys = keys.split('.')
+        keys = _split_key(keys)
 
     first = True
     exist = True
@@ -212,14 +266,14 @@ def deep_pop(d, keys, default=None):
     
     Args:
         d (dict): 要操作的字典
-        keys (list[str], str): 键路径
+        keys (tuple[str], list[str], str): 键路径
         default: 当键不存在时返回的默认值
 
     Returns:
         弹出的值，如果键不存在则返回默认值
     """
     if type(keys) is str:
-        keys = keys.split('.')
+        keys = _split_key(keys)
 
     try:
         for k in keys[:-1]:
@@ -276,6 +330,49 @@ def deep_iter_depth2(data):
         return
 
 
+def _iter_depth(items, depth, prefix):
+    """
+    深度优先迭代到指定深度，只遍历字典
+
+    Args:
+        items: 当前层字典的items()
+        depth (int): 剩余深度
+        prefix (tuple[str]): 当前层的键路径
+
+    Yields:
+        tuple[str]: 键路径
+        Any: 值
+    """
+    if depth == 1:
+        for k, v in items:
+            yield (*prefix, k), v
+    else:
+        depth -= 1
+        for k, v in items:
+            if type(v) is dict:
+                yield from _iter_depth(v.items(), depth, (*prefix, k))
+
+
+def _values_depth(values, depth):
+    """
+    深度优先迭代指定深度的值，只遍历字典
+
+    Args:
+        values: 当前层字典的values()
+        depth (int): 剩余深度
+
+    Yields:
+        Any: 值
+    """
+    if depth == 1:
+        yield from values
+    else:
+        depth -= 1
+        for v in values:
+            if type(v) is dict:
+                yield from _values_depth(v.values(), depth)
+
+
 def deep_iter(data, min_depth=None, depth=3):
     """
     迭代嵌套字典中的键和值
@@ -288,7 +385,7 @@ def deep_iter(data, min_depth=None, depth=3):
         depth: 最大迭代深度
 
     Yields:
-        list[str]: 键路径
+        tuple[str]: 键路径
         Any: 值
     """
     if min_depth is None:
@@ -296,27 +393,23 @@ def deep_iter(data, min_depth=None, depth=3):
     assert 1 <= min_depth <= depth
 
     try:
-        if depth == 1:  # 相当于dict.items()
-            for k, v in data.items():
-                yield [k], v
-            return
-        elif min_depth == 1:  # 迭代第一层
-            q = deque()
-            for k, v in data.items():
-                key = [k]
-                if type(v) is dict:
-                    q.append((key, v))
-                else:
-                    yield key, v
-        else:  # 只迭代目标深度
-            q = deque()
-            for k, v in data.items():
-                key = [k]
-                if type(v) is dict:
-                    q.append((key, v))
+        items = data.items()
     except AttributeError:  # data不是字典
         return
 
+    if min_depth == depth:  # 只迭代目标深度，深度优先，顺序与逐层迭代相同
+        yield from _iter_depth(items, depth, ())
+        return
+
+    # 迭代第一层
+    q = deque()
+    for k, v in items:
+        key = (k,)
+        if type(v) is dict:
+            q.append((key, v))
+        elif min_depth == 1:
+            yield key, v
+
     # 迭代各层
     current = 2
     while current <= depth:
@@ -324,11 +417,11 @@ def deep_iter(data, min_depth=None, depth=3):
         if current == depth:  # 最大深度
             for key, data in q:
                 for k, v in data.items():
-                    yield key + [k], v
+                    yield (*key, k), v
         elif min_depth <= current < depth:  # 在目标深度范围内
             for key, data in q:
                 for k, v in data.items():
-                    subkey = key + [k]
+                    subkey = (*key, k)
                     if type(v) is dict:
                         new_q.append((subkey, v))
                     else:
@@ -336,9 +429,8 @@ def deep_iter(data, min_depth=None, depth=3):
         else:  # 还未达到最小深度
             for key, data in q:
                 for k, v in data.items():
-                    subkey = key + [k]
                     if type(v) is dict:
-                        new_q.append((subkey, v))
+                        new_q.append(((*key, k), v))
         q = new_q
         current += 1
 
@@ -362,25 +454,22 @@ def deep_values(data, min_depth=None, depth=3):
     assert 1 <= min_depth <= depth
 
     try:
-        if depth == 1:  # 相当于dict.values()
-            for v in data.values():
-                yield v
-            return
-        elif min_depth == 1:  # 迭代第一层
-            q = deque()
-            for v in data.values():
-                if type(v) is dict:
-                    q.append(v)
-                else:
-                    yield v
-        else:  # 只迭代目标深度
-            q = deque()
-            for v in data.values():
-                if type(v) is dict:
-                    q.append(v)
+        values = data.values()
     except AttributeError:  # data不是字典
         return
 
+    if min_depth == depth:  # 只迭代目标深度
+        yield from _values_depth(values, depth)
+        return
+
+    # 迭代第一层
+    q = deque()
+    for v in values:
+        if type(v) is dict:
+            q.append(v)
+        elif min_depth == 1:
+            yield v
+
     # 迭代各层
     current = 2
     while current <= depth:
@@ -416,41 +505,39 @@ def deep_iter_diff(before, after):
         after: 新字典
 
     Yields:
-        list[str]: 键路径
+        tuple[str]: 键路径
         Any: before中的值，如果不存在则为None
         Any: after中的值，如果不存在则为None
     """
     if before == after:
         return
     if type(before) is not dict or type(after) is not dict:
-        yield [], before, after
+        yield (), before, after
         return
 
-    queue = deque([([], before, after)])
+    queue = deque([((), before, after)])
     while True:
         new_queue = deque()
         for path, d1, d2 in queue:
-            keys1 = set(d1.keys())
-            keys2 = set(d2.keys())
-            for key in keys1.union(keys2):
-                try:
-                    val2 = d2[key]
-                except KeyError:
-                    # 安全访问d1[key]，因为key来自两个集合的并集
-                    # 如果不在d2中，那么一定在d1中
-                    yield path + [key], d1[key], None
-                    continue
-                try:
-                    val1 = d1[key]
-                except KeyError:
-                    yield path + [key], None, val2
+            # 直接用字典键视图做集合运算，不额外创建两个set
+            keys1 = d1.keys()
+            keys2 = d2.keys()
+            for key in keys1 - keys2:
+                yield (*path, key), d1[key], None
+            for key in keys2 - keys1:
+                yield (*path, key), None, d2[key]
+            for key in keys1 & keys2:
+                val1 = d1[key]
+                val2 = d2[key]
+                # 同一个对象无需比较
+                if val1 is val2:
                     continue
                 # 首先比较字典，这很快
                 if val1 != val2:
                     if type(val1) is dict and type(val2) is dict:
-                        new_queue.append((path + [key], val1, val2))
+                        new_queue.append(((*path, key), val1, val2))
                     else:
-                        yield path + [key], val1, val2
+                        yield (*path, key), val1, val2
         queue = new_queue
         if not queue:
             break
@@ -468,38 +555,36 @@ def deep_iter_patch(before, after):
 
     Yields:
         str: 操作类型（OP_ADD, OP_SET, OP_DEL）
-        list[str]: 键路径
+        tuple[str]: 键路径
         Any: after中的值，如果是OP_DEL事件则为None
     """
     if before == after:
         return
     if type(before) is not dict or type(after) is not dict:
-        yield OP_SET, [], after
+        yield OP_SET, (), after
         return
 
-    queue = deque([([], before, after)])
+    queue = deque([((), before, after)])
     while True:
         new_queue = deque()
         for path, d1, d2 in queue:
-            keys1 = set(d1.keys())
-            keys2 = set(d2.keys())
-            for key in keys1.union(keys2):
-                try:
-                    val2 = d2[key]
-                except KeyError:
-                    yield OP_DEL, path + [key], None
-                    continue
-                try:
-                    val1 = d1[key]
-                except KeyError:
-                    yield OP_ADD, path + [key], val2
+            keys1 = d1.keys()
+            keys2 = d2.keys()
+            for key in keys1 - keys2:
+                yield OP_DEL, (*path, key), None
+            for key in keys2 - keys1:
+                yield OP_ADD, (*path, key), d2[key]
+            for key in keys1 & keys2:
+                val1 = d1[key]
+                val2 = d2[key]
+                if val1 is val2:
                     continue
                 # 首先比较字典，这很快
                 if val1 != val2:
                     if type(val1) is dict and type(val2) is dict:
-                        new_queue.append((path + [key], val1, val2))
+                        new_queue.append(((*path, key), val1, val2))
                     else:
-                        yield OP_SET, path + [key], val2
+                        yield OP_SET, (*path, key), val2
         queue = new_queue
         if not queue:
             break
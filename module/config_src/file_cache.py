@@ -0,0 +1,60 @@
+"""
+文件缓存模块，按文件的大小和修改时间缓存配置生成器输入文件的解析结果。
+文件未变化时跳过磁盘读取和YAML/JSON解析。
+"""
+
+import os
+from copy import deepcopy
+
+
+class FileCache:
+    """
+    进程内的文件解析结果缓存，只用于运行期间不会被改写的只读输入文件，
+    如ConfigGenerator读取的task.yaml、default.yaml、gui.yaml。
+
+    键：文件路径。值：((st_size, st_mtime_ns), data)
+    文件的大小或修改时间变化时缓存失效。
+    在修改时间精度之内以相同大小改写的文件无法识别，所以不要用于运行中会被写入的配置文件。
+    """
+    _cache = {}
+
+    @classmethod
+    def read(cls, path, loader):
+        """
+        读取文件，文件未变化时返回缓存的解析结果。
+
+        Args:
+            path (str): 文件路径
+            loader (callable): 缓存未命中时调用loader(path)读取并解析文件
+
+        Returns:
+            dict, list: 解析结果。
+                未命中时直接返回loader的结果并缓存，调用方不能修改；
+                命中时返回缓存的副本
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # 文件不存在等情况交给loader处理，不缓存
+            return loader(path)
+
+        key = (stat.st_size, stat.st_mtime_ns)
+        cached = cls._cache.get(path)
+        if cached is None or cached[0] != key:
+            data = loader(path)
+            cls._cache[path] = (key, data)
+            return data
+        return deepcopy(cached[1])
+
+    @classmethod
+    def clear(cls, path=None):
+        """
+        清除缓存。
+
+        Args:
+            path (str): 要清除的文件路径，None表示清除全部
+        """
+        if path is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(path, None)
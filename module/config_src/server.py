@@ -32,6 +32,35 @@ VALID_CLOUD_SERVER = {
 # 所有有效的云游戏包名集合
 VALID_CLOUD_PACKAGE = set(list(VALID_CLOUD_SERVER.values()))
 
+
+def _build_lookup(*mappings):
+    """
+    构建包名或服务器名称到目标值的查找表。
+    按映射的顺序，先出现的项优先，与逐项比较时的匹配顺序一致。
+
+    Args:
+        *mappings: (dict, bool) 服务器名称到包名的映射，以及查找结果是否取包名
+
+    Returns:
+        dict: 包名或服务器名称 -> 服务器名称或包名
+    """
+    lookup = {}
+    for mapping, to_package_ in mappings:
+        for key, value in mapping.items():
+            result = value if to_package_ else key
+            lookup.setdefault(value, result)
+            lookup.setdefault(key, result)
+    return lookup
+
+
+# 包名或服务器名称 -> 服务器名称
+_TO_SERVER = _build_lookup((VALID_SERVER, False), (VALID_CLOUD_SERVER, False))
+# 无法区分不同地区的国际服，假设为'OVERSEA-Asia'
+_TO_SERVER['com.HoYoverse.hkrpgoversea'] = 'OVERSEA-Asia'
+# 包名或服务器名称 -> 包名
+_TO_PACKAGE = _build_lookup((VALID_SERVER, True))
+_TO_CLOUD_PACKAGE = _build_lookup((VALID_CLOUD_SERVER, True))
+
 # 包名到启动Activity的映射
 DICT_PACKAGE_TO_ACTIVITY = {
     'com.miHoYo.hkrpg': 'com.mihoyo.combosdk.ComboSDKActivity',  # 国服官方
@@ -71,25 +100,10 @@ def to_server(package_or_server: str) -> str:
     Raises:
         ValueError: 当包名无效时抛出
     """
-    # 无法区分不同地区的国际服，
-    # 假设为'OVERSEA-Asia'
-    if package_or_server == 'com.HoYoverse.hkrpgoversea':
-        return 'OVERSEA-Asia'
-
-    # 检查普通服务器
-    for key, value in VALID_SERVER.items():
-        if value == package_or_server:
-            return key
-        if key == package_or_server:
-            return key
-    # 检查云游戏服务器
-    for key, value in VALID_CLOUD_SERVER.items():
-        if value == package_or_server:
-            return key
-        if key == package_or_server:
-            return key
-
-    raise ValueError(f'包名无效: {package_or_server}')
+    try:
+        return _TO_SERVER[package_or_server]
+    except KeyError:
+        raise ValueError(f'包名无效: {package_or_server}') from None
 
 
 def to_package(package_or_server: str, is_cloud=False) -> str:
@@ -106,19 +120,8 @@ def to_package(package_or_server: str, is_cloud=False) -> str:
     Raises:
         ValueError: 当服务器名称无效时抛出
     """
-    if is_cloud:
-        # 检查云游戏服务器
-        for key, value in VALID_CLOUD_SERVER.items():
-            if value == package_or_server:
-                return value
-            if key == package_or_server:
-                return value
-    else:
-        # 检查普通服务器
-        for key, value in VALID_SERVER.items():
-            if value == package_or_server:
-                return value
-            if key == package_or_server:
-                return value
-
-    raise ValueError(f'服务器无效: {package_or_server}')
+    lookup = _TO_CLOUD_PACKAGE if is_cloud else _TO_PACKAGE
+    try:
+        return lookup[package_or_server]
+    except KeyError:
+        raise ValueError(f'服务器无效: {package_or_server}') from None
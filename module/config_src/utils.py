@@ -2,14 +2,29 @@
 配置工具模块，提供了一系列用于处理配置文件、时间计算和数据类型转换的工具函数。
 """
 
+import hashlib
 import json
 import os
 import random
 import string
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import yaml
 
+# 优先使用libyaml的C实现，未编译libyaml时使用纯Python实现
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+# orjson为可选依赖，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import module.config_src.server as server_
 #from deploy.Windows.atomic import atomic_read_text, atomic_read_bytes, atomic_write
 
@@ -29,6 +44,10 @@ SERVER_TO_TIMEZONE = {
 # 默认时间：2020年1月1日
 DEFAULT_TIME = datetime(2020, 1, 1, 0, 0)
 
+if orjson is not None:
+    # datetime交给default=str处理，与json.dumps(default=str)的输出保持一致
+    ORJSON_OPTION = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 def str_presenter(dumper, data):
     """
@@ -50,6 +69,7 @@ def str_presenter(dumper, data):
 # 注册字符串格式化器
 yaml.add_representer(str, str_presenter)
 yaml.representer.SafeRepresenter.add_representer(str, str_presenter)
+yaml.add_representer(str, str_presenter, Dumper=YamlDumper)
 
 
 def filepath_args(filename='args', mod_name='alas'):
@@ -120,6 +140,76 @@ def filepath_code():
     return './module/config_src/config_generated.py'
 
 
+def json_loads(content):
+    """
+    解析JSON，优先使用orjson。
+
+    Args:
+        content (bytes, str):
+
+    Returns:
+        dict, list:
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson不接受NaN等非标准JSON，交给json处理
+            pass
+    return json.loads(content)
+
+
+def json_dumps(data):
+    """
+    序列化为缩进2格的JSON，优先使用orjson。
+
+    Args:
+        data (dict, list):
+
+    Returns:
+        bytes, str:
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=ORJSON_OPTION)
+        except TypeError:
+            # 超过64位的整数等orjson不支持的数据，交给json处理
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=False, default=str)
+
+
+def content_digest(content):
+    """
+    计算文件内容的摘要，用于判断两份文件内容是否相同。
+
+    Args:
+        content (bytes, str): 文件的原始内容或序列化结果
+
+    Returns:
+        bytes:
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def read_file_digest(file):
+    """
+    读取json文件，同时计算文件原始内容的摘要，不需要重新序列化。
+
+    Args:
+        file (str): 文件路径
+
+    Returns:
+        tuple[dict, bytes]: 文件内容，文件内容的摘要。文件为空或不存在时返回({}, None)
+    """
+    print(f'read: {file}')
+    content = atomic_read_bytes(file)
+    if not content:
+        return {}, None
+    return json_loads(content), content_digest(content)
+
+
 def read_file(file):
     """
     读取文件内容，支持.yaml和.json格式。
@@ -136,10 +226,10 @@ def read_file(file):
         content = atomic_read_bytes(file)
         if not content:
             return {}
-        return json.loads(content)
+        return json_loads(content)
     elif file.endswith('.yaml'):
         content = atomic_read_text(file)
-        data = list(yaml.safe_load_all(content))
+        data = list(yaml.load_all(content, Loader=YamlLoader))
         if len(data) == 1:
             data = data[0]
         if not data:
@@ -160,20 +250,34 @@ def write_file(file, data):
     """
     print(f'write: {file}')
     if file.endswith('.json'):
-        content = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=False, default=str)
+        content = json_dumps(data)
         atomic_write(file, content)
     elif file.endswith('.yaml'):
         if isinstance(data, list):
-            content = yaml.safe_dump_all(
-                data, default_flow_style=False, encoding='utf-8', allow_unicode=True, sort_keys=False)
+            content = yaml.dump_all(
+                data, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8', allow_unicode=True,
+                sort_keys=False)
         else:
-            content = yaml.safe_dump(
-                data, default_flow_style=False, encoding='utf-8', allow_unicode=True, sort_keys=False)
+            content = yaml.dump(
+                data, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8', allow_unicode=True,
+                sort_keys=False)
         atomic_write(file, content)
     else:
         print(f'不支持的配置文件扩展名: {file}')
 
 
+def write_content(file, content):
+    """
+    将已经序列化的内容写入文件。
+
+    Args:
+        file (str): 文件路径
+        content (bytes, str): 要写入的内容，如json_dumps()的结果
+    """
+    print(f'write: {file}')
+    atomic_write(file, content)
+
+
 def iter_folder(folder, is_dir=False, ext=None):
     """
     遍历文件夹中的文件或目录。
@@ -186,18 +290,19 @@ def iter_folder(folder, is_dir=False, ext=None):
     Yields:
         str: 文件或目录的绝对路径
     """
-    for file in os.listdir(folder):
-        sub = os.path.join(folder, file)
-        if is_dir:
-            if os.path.isdir(sub):
-                yield sub.replace('\\\\', '/').replace('\\', '/')
-        elif ext is not None:
-            if not os.path.isdir(sub):
-                _, extension = os.path.splitext(file)
-                if extension == ext:
-                    yield os.path.join(folder, file).replace('\\\\', '/').replace('\\', '/')
-        else:
-            yield os.path.join(folder, file).replace('\\\\', '/').replace('\\', '/')
+    # scandir的DirEntry缓存了文件类型，不需要每个文件再stat一次
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if is_dir:
+                if entry.is_dir():
+                    yield entry.path.replace('\\\\', '/').replace('\\', '/')
+            elif ext is not None:
+                if not entry.is_dir():
+                    _, extension = os.path.splitext(entry.name)
+                    if extension == ext:
+                        yield entry.path.replace('\\\\', '/').replace('\\', '/')
+            else:
+                yield entry.path.replace('\\\\', '/').replace('\\', '/')
 
 
 def alas_template():
@@ -236,6 +341,16 @@ def alas_instance():
     return out
 
 
+# parse_value()中直接转换的字符串
+_LITERAL_VALUES = {
+    '': None,
+    'true': True,
+    'True': True,
+    'false': False,
+    'False': False,
+}
+
+
 def parse_value(value, data):
     """
     将字符串转换为float、int、datetime等类型。
@@ -251,12 +366,11 @@ def parse_value(value, data):
         if value not in data['option']:
             return data['value']
     if isinstance(value, str):
-        if value == '':
-            return None
-        if value == 'true' or value == 'True':
-            return True
-        if value == 'false' or value == 'False':
-            return False
+        if value in _LITERAL_VALUES:
+            return _LITERAL_VALUES[value]
+        # 以字母开头的字符串不可能是数字或日期，跳过下面的异常处理
+        if value[0].isalpha():
+            return value
         if '.' in value:
             try:
                 return float(value)
@@ -320,6 +434,7 @@ def data_to_path(data):
     return '.'.join([data.get(attr, '') for attr in ['func', 'group', 'arg']])
 
 
+@lru_cache(maxsize=None)
 def path_to_arg(path):
     """
     将YAML文件中的字典键转换为配置中的参数名。
@@ -368,9 +483,30 @@ def server_time_offset() -> timedelta:
     Returns:
         timedelta: 时间偏移
     """
-    return datetime.now(timezone.utc).astimezone().utcoffset() - server_timezone()
+    return _local_utc_offset() - server_timezone()
+
+
+# 本地时区偏移的缓存，(偏移, 失效的时间戳)
+_LOCAL_UTC_OFFSET = (timedelta(0), 0.)
 
 
+def _local_utc_offset() -> timedelta:
+    """
+    获取本地时区偏移，结果缓存到下一个整15分钟。
+    夏令时切换可能发生在半点或整15分钟（如Lord Howe岛、时区偏移为xx:45的地区），
+    每15分钟刷新一次才能保证切换后及时生效。
+
+    Returns:
+        timedelta: 本地时区偏移
+    """
+    global _LOCAL_UTC_OFFSET
+    offset, expire = _LOCAL_UTC_OFFSET
+    now = time.time()
+    if now >= expire:
+        offset = datetime.now(timezone.utc).astimezone().utcoffset()
+        _LOCAL_UTC_OFFSET = (offset, now - now % 900 + 900)
+    return offset
+
 
 def ensure_time(second, n=3, precision=3):
     """
@@ -435,24 +571,51 @@ def get_os_reset_remain():
     return remain
 
 
-def get_server_next_update(daily_trigger):
+@lru_cache(maxsize=64)
+def _parse_trigger_times(triggers):
     """
-    获取下次服务器更新时间。
+    Args:
+        triggers (tuple[str]): 触发时间，如("00:00", "12:00")
+
+    Returns:
+        tuple[tuple[int, int]]: (小时, 分钟)
+    """
+    out = []
+    for t in triggers:
+        h, m = [int(x) for x in t.split(':')]
+        out.append((h, m))
+    return tuple(out)
+
+
+def _parse_daily_trigger(daily_trigger):
+    """
+    解析触发时间，相同的输入只解析一次。
 
     Args:
         daily_trigger (list[str], str): 触发时间列表，如["00:00", "12:00", "18:00"]
 
     Returns:
-        datetime: 下次更新时间
+        tuple[tuple[int, int]]: (小时, 分钟)
     """
     if isinstance(daily_trigger, str):
         daily_trigger = daily_trigger.replace(' ', '').split(',')
+    return _parse_trigger_times(tuple(daily_trigger))
+
+
+def get_server_next_update(daily_trigger):
+    """
+    获取下次服务器更新时间。
+
+    Args:
+        daily_trigger (list[str], str): 触发时间列表，如["00:00", "12:00", "18:00"]
 
+    Returns:
+        datetime: 下次更新时间
+    """
     diff = server_time_offset()
     local_now = datetime.now()
     trigger = []
-    for t in daily_trigger:
-        h, m = [int(x) for x in t.split(':')]
+    for h, m in _parse_daily_trigger(daily_trigger):
         future = local_now.replace(hour=h, minute=m, second=0, microsecond=0) + diff
         s = (future - local_now).total_seconds() % 86400
         future = local_now + timedelta(seconds=s)
@@ -471,14 +634,10 @@ def get_server_last_update(daily_trigger):
     Returns:
         datetime: 上次更新时间
     """
-    if isinstance(daily_trigger, str):
-        daily_trigger = daily_trigger.replace(' ', '').split(',')
-
     diff = server_time_offset()
     local_now = datetime.now()
     trigger = []
-    for t in daily_trigger:
-        h, m = [int(x) for x in t.split(':')]
+    for h, m in _parse_daily_trigger(daily_trigger):
         future = local_now.replace(hour=h, minute=m, second=0, microsecond=0) + diff
         s = (future - local_now).total_seconds() % 86400 - 86400
         future = local_now + timedelta(seconds=s)
@@ -532,11 +691,17 @@ def nearest_future(future, interval=120):
         datetime: 最近的未来时间
     """
     future = [datetime.fromisoformat(f) if isinstance(f, str) else f for f in future]
-    future = sorted(future)
+    if len(future) == 1:
+        return future[0]
+    future.sort()
+    interval = timedelta(seconds=interval)
     next_run = future[0]
     for finish in future:
-        if finish - next_run < timedelta(seconds=interval):
+        if finish - next_run < interval:
             next_run = finish
+        else:
+            # 已排序，后面的时间点只会相隔更远
+            break
 
     return next_run
 
@@ -578,6 +743,10 @@ def get_server_weekday():
     return result
 
 
+# random_id()使用的字符集
+_ID_ALPHABET = string.ascii_lowercase + string.digits
+
+
 def random_id(length=32):
     """
     生成随机ID。
@@ -588,7 +757,8 @@ def random_id(length=32):
     Returns:
         str: 随机ID
     """
-    return ''.join(random.sample(string.ascii_lowercase + string.digits, length))
+    # 可重复抽取，长度超过字符集大小时也能生成
+    return ''.join(random.choices(_ID_ALPHABET, k=length))
 
 
 def to_list(text, length=1):
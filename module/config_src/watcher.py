@@ -6,7 +6,7 @@
 import os
 from datetime import datetime
 
-from module.config_src.utils import filepath_config, DEFAULT_TIME
+from module.config_src.utils import filepath_config
 from module.base.logger import logger
 
 
@@ -16,17 +16,43 @@ class ConfigWatcher:
     
     属性:
         config_name: 配置文件名，默认为'alas'
-        start_mtime: 开始监视时的时间戳，默认为DEFAULT_TIME
+        start_mtime_ns: 开始监视时的修改时间，单位纳秒，截断到秒
     """
     config_name = 'alas'
-    start_mtime = DEFAULT_TIME
+    start_mtime_ns = 0
+    # (config_name, 配置文件路径)
+    _config_path = None
 
     def start_watching(self) -> None:
         """
         开始监视配置文件
         记录当前配置文件的修改时间作为基准时间
         """
-        self.start_mtime = self.get_mtime()
+        self._config_path = (self.config_name, filepath_config(self.config_name))
+        self.start_mtime_ns = self.get_mtime_ns()
+
+    def config_path(self) -> str:
+        """
+        获取配置文件路径，缓存路径拼接的结果
+
+        Returns:
+            str: 配置文件路径
+        """
+        cached = self._config_path
+        if cached is None or cached[0] != self.config_name:
+            cached = (self.config_name, filepath_config(self.config_name))
+            self._config_path = cached
+        return cached[1]
+
+    def get_mtime_ns(self) -> int:
+        """
+        获取配置文件的最后修改时间，直接比较整数，不创建datetime对象
+
+        Returns:
+            int: 配置文件的最后修改时间，单位纳秒（精确到秒）
+        """
+        mtime_ns = os.stat(self.config_path()).st_mtime_ns
+        return mtime_ns - mtime_ns % 1_000_000_000
 
     def get_mtime(self) -> datetime:
         """
@@ -35,9 +61,7 @@ class ConfigWatcher:
         Returns:
             datetime: 配置文件的最后修改时间（精确到秒）
         """
-        timestamp = os.stat(filepath_config(self.config_name)).st_mtime
-        mtime = datetime.fromtimestamp(timestamp).replace(microsecond=0)
-        return mtime
+        return datetime.fromtimestamp(self.get_mtime_ns() // 1_000_000_000)
 
     def should_reload(self) -> bool:
         """
@@ -49,8 +73,9 @@ class ConfigWatcher:
         Returns:
             bool: 如果配置文件被修改过，返回True，否则返回False
         """
-        mtime = self.get_mtime()
-        if mtime > self.start_mtime:
+        mtime_ns = self.get_mtime_ns()
+        if mtime_ns > self.start_mtime_ns:
+            mtime = datetime.fromtimestamp(mtime_ns // 1_000_000_000)
             logger.info(f'Config "{self.config_name}" changed at {mtime}')
             return True
         else:
@@ -0,0 +1,48 @@
+"""
+深层字典操作测试模块。
+测试deep_set在路径中包含列表时的行为。
+"""
+
+from module.config_src.deep import deep_get, deep_set
+
+
+def test_deep_set_dict_path():
+    d = {'a': {'b': 1}}
+    deep_set(d, 'a.c.d', 2)
+    assert d == {'a': {'b': 1, 'c': {'d': 2}}}
+
+    # 中间层不是字典时替换为字典
+    deep_set(d, 'a.b.e', 3)
+    assert d == {'a': {'b': {'e': 3}, 'c': {'d': 2}}}
+
+
+def test_deep_set_list_in_middle():
+    # 中间层是列表时按整数下标进入，保留列表和元素中已有的数据
+    d = {'c': {'b': [{'y': 1}, {}]}}
+    deep_set(d, ['c', 'b', 0, 'x'], 'V')
+    assert d == {'c': {'b': [{'y': 1, 'x': 'V'}, {}]}}
+
+    deep_set(d, ('c', 'b', 1, 'p', 'q'), 'W')
+    assert d == {'c': {'b': [{'y': 1, 'x': 'V'}, {'p': {'q': 'W'}}]}}
+    assert deep_get(d, ['c', 'b', 1, 'p', 'q']) == 'W'
+
+
+def test_deep_set_nested_list():
+    d = {'l': [[1, 2]]}
+    deep_set(d, ['l', 0, 1], 'V')
+    assert d == {'l': [[1, 'V']]}
+
+    # 列表元素不是容器时替换为字典
+    deep_set(d, ['l', 0, 0, 'k'], 'W')
+    assert d == {'l': [[{'k': 'W'}, 'V']]}
+
+
+def test_deep_set_list_at_last_level():
+    d = {'a': [1, 2, 3]}
+    deep_set(d, ['a', 1], 'V')
+    assert d == {'a': [1, 'V', 3]}
+
+    # 字符串不能作为列表下标，整个列表替换为字典
+    deep_set(d, 'a.0', 'W')
+    assert d == {'a': {'0': 'W'}}
+
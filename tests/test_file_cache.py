@@ -0,0 +1,95 @@
+"""
+文件缓存测试模块。
+测试FileCache在文件变化时失效，以及命中缓存时返回的数据相互隔离。
+"""
+
+import json
+import os
+
+import pytest
+
+from module.config_src.file_cache import FileCache
+
+
+class CountingLoader:
+    """记录调用次数的json读取函数"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, path):
+        self.count += 1
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+@pytest.fixture
+def loader():
+    FileCache.clear()
+    yield CountingLoader()
+    FileCache.clear()
+
+
+def _write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_file_cache_hit(tmp_path, loader):
+    path = str(tmp_path / 'config.json')
+    _write(path, {'a': 1})
+
+    assert FileCache.read(path, loader) == {'a': 1}
+    assert FileCache.read(path, loader) == {'a': 1}
+    assert loader.count == 1
+
+
+def test_file_cache_invalidate_on_size(tmp_path, loader):
+    path = str(tmp_path / 'config.json')
+    _write(path, {'a': 1})
+    stat = os.stat(path)
+    assert FileCache.read(path, loader) == {'a': 1}
+
+    # 大小变化，修改时间不变
+    _write(path, {'a': 12})
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert FileCache.read(path, loader) == {'a': 12}
+    assert loader.count == 2
+
+
+def test_file_cache_invalidate_on_mtime(tmp_path, loader):
+    path = str(tmp_path / 'config.json')
+    _write(path, {'a': 1})
+    stat = os.stat(path)
+    assert FileCache.read(path, loader) == {'a': 1}
+
+    # 大小不变，修改时间变化
+    _write(path, {'a': 2})
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert FileCache.read(path, loader) == {'a': 2}
+    assert loader.count == 2
+
+
+def test_file_cache_isolated(tmp_path, loader):
+    path = str(tmp_path / 'config.json')
+    _write(path, {'a': {'b': [1, 2]}})
+
+    # 未命中时返回loader的结果本身，不复制
+    first = FileCache.read(path, loader)
+    assert first is FileCache._cache[path][1]
+
+    # 命中时返回副本，修改不会影响之后的读取
+    data = FileCache.read(path, loader)
+    assert data is not first
+    data['a']['b'].append(3)
+    data['c'] = 4
+    assert FileCache.read(path, loader) == {'a': {'b': [1, 2]}}
+    assert loader.count == 1
+
+
+def test_file_cache_missing_file(tmp_path, loader):
+    path = str(tmp_path / 'missing.json')
+
+    with pytest.raises(FileNotFoundError):
+        FileCache.read(path, loader)
+    assert path not in FileCache._cache
@@ -0,0 +1,44 @@
+"""
+点集合拟合测试模块。
+测试fit_points在使用numba编译和纯numpy时结果一致。
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+pytest.importorskip('numba')
+# area_pad所在的image_utils依赖cv2和PIL
+pytest.importorskip('cv2')
+pytest.importorskip('PIL')
+
+from module.base import points as points_module
+from module.base.points import fit_points
+
+
+def _grid_points(offset, mod, noise=None):
+    points = np.array([[x * mod[0], y * mod[1]] for x in range(5) for y in range(4)], dtype=float)
+    points += offset
+    if noise is not None:
+        points += noise
+    return points
+
+
+def test_fit_points_grid():
+    mod = (140, 100)
+    result = fit_points(_grid_points((17, 33), mod), mod=mod, encourage=1)
+    assert np.allclose(result, (17, 33), atol=0.5)
+
+
+@pytest.mark.parametrize('encourage', [1, 2, 3])
+def test_fit_points_numba_matches_numpy(monkeypatch, encourage):
+    mod = (140, 100)
+    rng = np.random.default_rng(encourage)
+    points = _grid_points((61, 12), mod, noise=rng.uniform(-3, 3, (20, 2)))
+
+    compiled = fit_points(points, mod=mod, encourage=encourage)
+    # 编译后的函数保留原始Python函数，用它走纯numpy路径
+    monkeypatch.setattr(points_module, '_fit_cost', points_module._fit_cost.py_func)
+    plain = fit_points(points, mod=mod, encourage=encourage)
+
+    assert np.allclose(compiled, plain, atol=1e-6)